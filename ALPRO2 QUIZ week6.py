@@ -1,24 +1,198 @@
 import time
 import random
-import pandas as pd
-import matplotlib.pyplot as plt
-from tabulate import tabulate
+import sys
+import csv
+import json
+import math
+import numbers
+import statistics
+# numpy, subprocess, concurrent.futures, pandas, matplotlib dan tabulate di-import di dalam
+# fungsi yang memakainya, agar jalur struk dan mode headless tidak membayar waktu start-up
+# library tersebut (bandingkan dengan --importtime)
 
 # Kelas Item untuk menyimpan data item belanja
 class Item:
+    # __slots__ menghilangkan __dict__ per objek sehingga setiap item lebih hemat memori
+    __slots__ = ("nama", "harga", "kategori")
+    
     def __init__(self, nama, harga, kategori=None):
         self.nama = nama
         self.harga = harga
         self.kategori = kategori
 
+# Keranjang belanja berbentuk kolom (columnar) berbasis NumPy
+class KeranjangKolom:
+    """
+    Menyimpan keranjang sebagai kolom, bukan list objek Item:
+    - harga: array int64
+    - nama dan kategori: kode int32 yang menunjuk ke daftar_nama / daftar_kategori
+      (dictionary encoding), ditambah nomor opsional sehingga nama = "<nama> <nomor>"
+    Total, diskon dan subtotal per kategori dihitung secara vektor.
+    Iterasi dan indexing tetap menghasilkan Item agar kompatibel dengan fungsi lama.
+    """
+    def __init__(self, harga, kode_nama, kode_kategori, daftar_nama, daftar_kategori, nomor=None):
+        import numpy as np
+        self.harga = np.asarray(harga, dtype=np.int64)
+        self.kode_nama = np.asarray(kode_nama, dtype=np.int32)
+        self.kode_kategori = np.asarray(kode_kategori, dtype=np.int32)
+        self.daftar_nama = list(daftar_nama)
+        self.daftar_kategori = list(daftar_kategori)
+        self.nomor = None if nomor is None else np.asarray(nomor, dtype=np.int64)
+    
+    @classmethod
+    def dari_items(cls, items):
+        """Membuat keranjang kolom dari list Item"""
+        daftar_nama, daftar_kategori = {}, {}
+        kode_nama = [daftar_nama.setdefault(item.nama, len(daftar_nama)) for item in items]
+        kode_kategori = [daftar_kategori.setdefault(item.kategori, len(daftar_kategori)) for item in items]
+        harga = [item.harga for item in items]
+        return cls(harga, kode_nama, kode_kategori, daftar_nama, daftar_kategori)
+    
+    def __len__(self):
+        return len(self.harga)
+    
+    def nama(self, i):
+        """Nama item ke-i"""
+        nama = self.daftar_nama[self.kode_nama[i]]
+        return nama if self.nomor is None else f"{nama} {self.nomor[i]}"
+    
+    def __getitem__(self, i):
+        return Item(self.nama(i), int(self.harga[i]), self.daftar_kategori[self.kode_kategori[i]])
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+    
+    def subtotal(self):
+        """Jumlah harga semua item"""
+        return int(self.harga.sum())
+    
+    def total(self, diskon=0):
+        """Total setelah diskon (hasilnya sama dengan hitung_total_on)"""
+        total = self.subtotal()
+        if diskon > 0:
+            total = total * (1 - diskon/100)
+        return total
+    
+    def subtotal_per_kategori(self):
+        """Subtotal harga untuk setiap kategori: {kategori: subtotal}"""
+        import numpy as np
+        jumlah = np.zeros(len(self.daftar_kategori), dtype=np.int64)
+        np.add.at(jumlah, self.kode_kategori, self.harga)
+        return {kat: int(jumlah[i]) for i, kat in enumerate(self.daftar_kategori)}
+    
+    def total_per_kategori(self, diskon=0):
+        """Total per kategori setelah diskon"""
+        faktor = (1 - diskon/100) if diskon > 0 else 1
+        return {kat: subtotal * faktor for kat, subtotal in self.subtotal_per_kategori().items()}
+
+# Keranjang dengan total berjalan (running total)
+class KeranjangBerjalan:
+    """
+    Keranjang yang menyimpan subtotal, jumlah item dan subtotal per kategori secara berjalan.
+    Setiap tambah, hapus dan ubah jumlah memperbarui nilai-nilai tersebut, sehingga
+    total(diskon) cukup O(1) tanpa menjumlah ulang semua item setelah setiap scan.
+    Seperti list Item, keranjang bisa di-iterasi dan diindeks per unit (keranjang[i]).
+    """
+    def __init__(self):
+        self._baris = {}  # id baris -> [item, jumlah]
+        self._id_berikutnya = 1
+        self.subtotal = 0
+        self.jumlah_item = 0
+        self.subtotal_kategori = {}
+        self._unit_kategori = {}
+        self._unit = None  # daftar Item per unit untuk indexing, dibuat ulang setelah keranjang berubah
+    
+    @classmethod
+    def dari_items(cls, items):
+        """Membuat keranjang berjalan dari list Item (satu baris per item)"""
+        keranjang = cls()
+        for item in items:
+            keranjang.tambah(item)
+        return keranjang
+    
+    def _perbarui(self, item, selisih_jumlah):
+        """Memperbarui semua agregat untuk perubahan jumlah sebuah item"""
+        self._unit = None
+        selisih_harga = item.harga * selisih_jumlah
+        self.subtotal += selisih_harga
+        self.jumlah_item += selisih_jumlah
+        unit_baru = self._unit_kategori.get(item.kategori, 0) + selisih_jumlah
+        if unit_baru == 0:
+            # Kategori kosong dibuang agar ringkasan hanya berisi kategori yang ada di keranjang
+            del self._unit_kategori[item.kategori]
+            del self.subtotal_kategori[item.kategori]
+        else:
+            self._unit_kategori[item.kategori] = unit_baru
+            self.subtotal_kategori[item.kategori] = self.subtotal_kategori.get(item.kategori, 0) + selisih_harga
+    
+    def tambah(self, item, jumlah=1):
+        """Menambahkan item (hasil scan) dan mengembalikan id baris"""
+        if jumlah < 1:
+            raise ValueError("Jumlah minimal 1")
+        id_baris = self._id_berikutnya
+        self._id_berikutnya += 1
+        self._baris[id_baris] = [item, jumlah]
+        self._perbarui(item, jumlah)
+        return id_baris
+    
+    def hapus(self, id_baris):
+        """Menghapus satu baris dari keranjang"""
+        item, jumlah = self._baris.pop(id_baris)
+        self._perbarui(item, -jumlah)
+    
+    def ubah_jumlah(self, id_baris, jumlah):
+        """Mengubah jumlah pada satu baris; jumlah 0 berarti baris dihapus"""
+        if jumlah < 0:
+            raise ValueError("Jumlah tidak boleh negatif")
+        if jumlah == 0:
+            self.hapus(id_baris)
+            return
+        baris = self._baris[id_baris]
+        selisih = jumlah - baris[1]
+        baris[1] = jumlah
+        self._perbarui(baris[0], selisih)
+    
+    def total(self, diskon=0):
+        """Total setelah diskon dalam O(1)"""
+        total = self.subtotal
+        if diskon > 0:
+            total = total * (1 - diskon/100)
+        return total
+    
+    def total_kategori(self, kategori, diskon=0):
+        """Total satu kategori setelah diskon dalam O(1)"""
+        total = self.subtotal_kategori.get(kategori, 0)
+        if diskon > 0:
+            total = total * (1 - diskon/100)
+        return total
+    
+    def __len__(self):
+        return self.jumlah_item
+    
+    def __iter__(self):
+        # Satu Item per unit, agar bisa dipakai cetak_struk dan fungsi hitung_total lainnya
+        for item, jumlah in self._baris.values():
+            for _ in range(jumlah):
+                yield item
+    
+    def __getitem__(self, i):
+        # Unit ke-i dengan urutan yang sama seperti iterasi (mendukung index negatif dan slice)
+        if self._unit is None:
+            self._unit = list(self)
+        return self._unit[i]
+
 # Implementasi O(1) - Konstant Time
 def hitung_total_o1(items, diskon=0):
     """
     Menghitung total belanja dengan kompleksitas O(1).
     Memanfaatkan pre-calculated sum yang biasanya sudah tersedia di database atau cache.
+    Benar-benar O(1) untuk KeranjangBerjalan; untuk list Item biasa tetap perlu menjumlah (O(n)).
     """
     # Dalam situasi nyata, total harga mungkin sudah dihitung oleh sistem POS
     # dan disimpan dalam variabel, sehingga kita hanya perlu mengambilnya
+    if isinstance(items, (KeranjangBerjalan, KeranjangKolom)):
+        return items.total(diskon)
     total = sum(item.harga for item in items)
     if diskon > 0:
         total = total * (1 - diskon/100)
@@ -65,11 +239,28 @@ def hitung_total_on2(items, diskon=0):
     return total
 
 # Fungsi untuk membuat data belanja dengan jumlah item tertentu
-def buat_data_belanja(n):
+def buat_data_belanja(n, kolom=False):
+    """
+    Membuat n item belanja acak.
+    kolom=True langsung menghasilkan KeranjangKolom (tanpa membuat objek Item satu per satu).
+    """
     barang = ["Apel", "Jeruk", "Pisang", "Anggur", "Mangga", "Roti", "Susu", "Keju", 
               "Telur", "Daging", "Ikan", "Beras", "Mie", "Sabun", "Shampo"]
     kategori = ["Buah", "Makanan", "Minuman", "Kebutuhan Rumah Tangga"]
     
+    if kolom:
+        import numpy as np
+        # Seed diambil dari modul random agar random.seed() tetap berlaku
+        rng = np.random.default_rng(random.getrandbits(64))
+        return KeranjangKolom(
+            harga=rng.integers(5000, 100000, size=n, endpoint=True),
+            kode_nama=rng.integers(0, len(barang), size=n),
+            kode_kategori=rng.integers(0, len(kategori), size=n),
+            daftar_nama=barang,
+            daftar_kategori=kategori,
+            nomor=np.arange(1, n + 1)
+        )
+    
     items = []
     for i in range(n):
         nama = f"{random.choice(barang)} {i+1}"
@@ -79,6 +270,116 @@ def buat_data_belanja(n):
     
     return items
 
+# Harness micro-benchmark: perf_counter_ns, pemanasan, ulangan dan kalibrasi jumlah loop
+def ukur_fungsi(fungsi, *args, ulangan=7, pemanasan=2, waktu_min_ns=2_000_000, **kwargs):
+    """
+    Mengukur waktu satu panggilan fungsi dalam nanodetik.
+    Jumlah loop per ulangan dikalibrasi otomatis (dilipatgandakan) sampai satu ulangan
+    memakan waktu minimal waktu_min_ns, sehingga resolusi jam tidak mendominasi hasil.
+    Mengembalikan daftar waktu per panggilan (ns), satu nilai untuk setiap ulangan.
+    """
+    for _ in range(pemanasan):
+        fungsi(*args, **kwargs)
+    
+    # Kalibrasi jumlah loop
+    loop = 1
+    while True:
+        mulai = time.perf_counter_ns()
+        for _ in range(loop):
+            fungsi(*args, **kwargs)
+        durasi = time.perf_counter_ns() - mulai
+        if durasi >= waktu_min_ns:
+            break
+        loop *= 2
+    
+    sampel = [durasi / loop]
+    for _ in range(ulangan - 1):
+        mulai = time.perf_counter_ns()
+        for _ in range(loop):
+            fungsi(*args, **kwargs)
+        sampel.append((time.perf_counter_ns() - mulai) / loop)
+    return sampel
+
+def ringkas_sampel(sampel):
+    """Median, p95 dan simpangan baku dari sampel waktu (ns)"""
+    urut = sorted(sampel)
+    indeks_p95 = min(len(urut) - 1, math.ceil(0.95 * len(urut)) - 1)
+    return {
+        "median_ns": statistics.median(urut),
+        "p95_ns": urut[indeks_p95],
+        "stdev_ns": statistics.stdev(urut) if len(urut) > 1 else 0.0,
+    }
+
+def taksir_eksponen(ukuran_data, waktu):
+    """
+    Menaksir eksponen kompleksitas k pada waktu ~ c * n^k dengan regresi
+    kuadrat terkecil pada log(waktu) terhadap log(n).
+    """
+    xs = [math.log(n) for n in ukuran_data]
+    ys = [math.log(max(t, 1e-9)) for t in waktu]
+    rata_x = sum(xs) / len(xs)
+    rata_y = sum(ys) / len(ys)
+    penyebut = sum((x - rata_x) ** 2 for x in xs)
+    if penyebut == 0:
+        return 0.0
+    return sum((x - rata_x) * (y - rata_y) for x, y in zip(xs, ys)) / penyebut
+
+def uji_kinerja_presisi(ukuran_data=None, diskon=10, ulangan=7, pemanasan=2, waktu_min_ns=2_000_000):
+    """
+    Benchmark semua implementasi hitung_total untuk beberapa ukuran data, termasuk
+    hitung_total_o1 pada KeranjangBerjalan dan KeranjangKolom (keranjang dibangun di luar
+    waktu yang diukur). Mengembalikan dict berisi baris hasil (median, p95, stdev per metode dan ukuran)
+    serta taksiran eksponen kompleksitas per metode.
+    """
+    if ukuran_data is None:
+        ukuran_data = [10, 50, 100, 200, 500]
+    # nama metode -> (fungsi, pembuat input dari list Item)
+    metode = {
+        "O(1)": (hitung_total_o1, list),
+        "O(1) berjalan": (hitung_total_o1, KeranjangBerjalan.dari_items),
+        "O(1) kolom": (hitung_total_o1, KeranjangKolom.dari_items),
+        "O(n)": (hitung_total_on, list),
+        "O(n²)": (hitung_total_on2, list),
+    }
+    
+    baris = []
+    median_per_metode = {nama: [] for nama in metode}
+    for n in ukuran_data:
+        items = buat_data_belanja(n)
+        for nama, (fungsi, buat_input) in metode.items():
+            sampel = ukur_fungsi(fungsi, buat_input(items), diskon, ulangan=ulangan,
+                                 pemanasan=pemanasan, waktu_min_ns=waktu_min_ns)
+            ringkasan = ringkas_sampel(sampel)
+            median_per_metode[nama].append(ringkasan["median_ns"])
+            baris.append({"metode": nama, "n": n, "ulangan": len(sampel), **ringkasan})
+    
+    eksponen = {}
+    if len(ukuran_data) > 1:
+        eksponen = {nama: taksir_eksponen(ukuran_data, waktu) for nama, waktu in median_per_metode.items()}
+    return {"baris": baris, "eksponen": eksponen}
+
+def simpan_hasil_kinerja(hasil, path):
+    """Menyimpan hasil uji_kinerja_presisi ke JSON atau CSV (ditentukan dari ekstensi file)"""
+    if path.lower().endswith(".csv"):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            penulis = csv.DictWriter(f, fieldnames=["metode", "n", "ulangan", "median_ns", "p95_ns", "stdev_ns", "eksponen"])
+            penulis.writeheader()
+            for baris in hasil["baris"]:
+                penulis.writerow({**baris, "eksponen": hasil["eksponen"].get(baris["metode"], "")})
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(hasil, f, indent=2, ensure_ascii=False)
+
+def tampilkan_hasil_kinerja(hasil):
+    """Menampilkan hasil benchmark sebagai tabel teks biasa"""
+    print(f"{'Metode':<16}{'n':>8}{'Median (ns)':>16}{'p95 (ns)':>16}{'Stdev (ns)':>16}")
+    print("-" * 72)
+    for baris in hasil["baris"]:
+        print(f"{baris['metode']:<16}{baris['n']:>8}{baris['median_ns']:>16,.0f}"
+              f"{baris['p95_ns']:>16,.0f}{baris['stdev_ns']:>16,.0f}")
+    for nama, k in hasil["eksponen"].items():
+        print(f"Eksponen empiris {nama}: n^{k:.2f}")
+
 # Fungsi untuk menjalankan pengujian kinerja
 def uji_kinerja():
     ukuran_data = [10, 50, 100, 200, 500]
@@ -92,23 +393,20 @@ def uji_kinerja():
     for n in ukuran_data:
         items = buat_data_belanja(n)
         
-        # Ukur waktu untuk O(1)
-        start = time.time()
+        # Ukur waktu untuk O(1) (median beberapa ulangan, dalam detik)
         total_o1 = hitung_total_o1(items, diskon=10)
-        end = time.time()
-        hasil["O(1) Waktu (detik)"].append(round(end - start, 6))
+        waktu = ringkas_sampel(ukur_fungsi(hitung_total_o1, items, 10))["median_ns"] / 1e9
+        hasil["O(1) Waktu (detik)"].append(round(waktu, 9))
         
-        # Ukur waktu untuk O(n)
-        start = time.time()
+        # Ukur waktu untuk O(n) (median beberapa ulangan, dalam detik)
         total_on = hitung_total_on(items, diskon=10)
-        end = time.time()
-        hasil["O(n) Waktu (detik)"].append(round(end - start, 6))
+        waktu = ringkas_sampel(ukur_fungsi(hitung_total_on, items, 10))["median_ns"] / 1e9
+        hasil["O(n) Waktu (detik)"].append(round(waktu, 9))
         
-        # Ukur waktu untuk O(n²)
-        start = time.time()
+        # Ukur waktu untuk O(n²) (median beberapa ulangan, dalam detik)
         total_on2 = hitung_total_on2(items, diskon=10)
-        end = time.time()
-        hasil["O(n²) Waktu (detik)"].append(round(end - start, 6))
+        waktu = ringkas_sampel(ukur_fungsi(hitung_total_on2, items, 10))["median_ns"] / 1e9
+        hasil["O(n²) Waktu (detik)"].append(round(waktu, 9))
         
         # Verifikasi bahwa semua algoritma menghasilkan nilai yang sama
         assert abs(total_o1 - total_on) < 0.01, "Hasil O(1) dan O(n) berbeda!"
@@ -116,33 +414,190 @@ def uji_kinerja():
     
     return hasil
 
-# Fungsi untuk menampilkan struk belanja
-def cetak_struk(items, diskon=0):
-    print("=" * 50)
-    print("               STRUK BELANJA                ")
-    print("=" * 50)
-    print(f"{'No':<5}{'Nama Barang':<30}{'Harga':>15}")
-    print("-" * 50)
+# Fungsi untuk menyusun teks struk belanja dalam satu buffer
+def render_struk(items, diskon=0):
+    """
+    Menyusun struk sebagai satu string (list baris yang di-join sekali).
+    Hasilnya identik byte-per-byte dengan output cetak_struk versi lama yang memakai print per baris.
+    """
+    garis = "=" * 50
+    baris = [
+        garis,
+        "               STRUK BELANJA                ",
+        garis,
+        f"{'No':<5}{'Nama Barang':<30}{'Harga':>15}",
+        "-" * 50,
+    ]
     
+    subtotal = 0
     for i, item in enumerate(items, 1):
-        print(f"{i:<5}{item.nama:<30}Rp {item.harga:>12,.0f}")
+        baris.append(f"{i:<5}{item.nama:<30}Rp {item.harga:>12,.0f}")
+        subtotal += item.harga
     
-    subtotal = sum(item.harga for item in items)
-    print("-" * 50)
-    print(f"{'Subtotal':<35}Rp {subtotal:>12,.0f}")
+    baris.append("-" * 50)
+    baris.append(f"{'Subtotal':<35}Rp {subtotal:>12,.0f}")
     
     if diskon > 0:
         nilai_diskon = subtotal * (diskon/100)
         total = subtotal - nilai_diskon
-        print(f"{'Diskon (' + str(diskon) + '%)':<35}Rp {nilai_diskon:>12,.0f}")
-        print(f"{'Total':<35}Rp {total:>12,.0f}")
+        baris.append(f"{'Diskon (' + str(diskon) + '%)':<35}Rp {nilai_diskon:>12,.0f}")
+        baris.append(f"{'Total':<35}Rp {total:>12,.0f}")
+    
+    baris.append(garis)
+    baris.append("Terima kasih telah berbelanja!")
+    baris.append(garis)
+    baris.append("")
+    return "\n".join(baris)
+
+def _render_struk_argumen(argumen):
+    # Pembungkus untuk executor.map, argumen berupa (items, diskon)
+    return render_struk(*argumen)
+
+# Fungsi untuk menampilkan struk belanja
+def cetak_struk(items, diskon=0, file=None):
+    """Mencetak struk dengan satu kali write ke stdout (atau file/stream yang diberikan)"""
+    (file or sys.stdout).write(render_struk(items, diskon))
+
+def tulis_struk_massal(daftar_keranjang, tujuan, diskon=0, workers=None, ukuran_batch=256):
+    """
+    Menulis banyak struk sekaligus ke file (path) atau stream.
+    daftar_keranjang berisi keranjang (list Item, KeranjangKolom atau KeranjangBerjalan);
+    diskon bisa satu angka untuk semua struk atau list dengan panjang yang sama.
+    Struk digabung per batch lalu ditulis dengan satu write per batch.
+    Jika workers > 1, pemformatan dibagi ke ProcessPoolExecutor (urutan struk tetap dipertahankan).
+    Mengembalikan jumlah struk yang ditulis.
+    """
+    # numbers.Real juga mencakup angka numpy (misalnya numpy.float64 dari KeranjangKolom)
+    if isinstance(diskon, numbers.Real):
+        daftar_diskon = [diskon] * len(daftar_keranjang)
+    else:
+        daftar_diskon = list(diskon)
+        if len(daftar_diskon) != len(daftar_keranjang):
+            raise ValueError("Panjang daftar diskon harus sama dengan jumlah keranjang")
+    argumen = list(zip(daftar_keranjang, daftar_diskon))
+    
+    def tulis(stream):
+        if workers is not None and workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                hasil = executor.map(_render_struk_argumen, argumen,
+                                     chunksize=max(1, len(argumen) // (workers * 4)))
+                batch = []
+                for teks in hasil:
+                    batch.append(teks)
+                    if len(batch) >= ukuran_batch:
+                        stream.write("".join(batch))
+                        batch = []
+                if batch:
+                    stream.write("".join(batch))
+        else:
+            for mulai in range(0, len(argumen), ukuran_batch):
+                stream.write("".join(render_struk(items, d) for items, d in argumen[mulai:mulai + ukuran_batch]))
     
-    print("=" * 50)
-    print("Terima kasih telah berbelanja!")
-    print("=" * 50)
+    if isinstance(tujuan, str):
+        with open(tujuan, "w", encoding="utf-8") as f:
+            tulis(f)
+    else:
+        tulis(tujuan)
+    return len(argumen)
+
+# Mode headless: hanya menghitung dan mencetak struk, tanpa input, tabel atau grafik
+def jalankan_headless(jumlah_item=5, diskon=10):
+    items = buat_data_belanja(jumlah_item)
+    cetak_struk(items, diskon)
+    
+    keranjang = KeranjangBerjalan()
+    for item in items:
+        keranjang.tambah(item)
+    print(f"Total (O(1)): Rp {hitung_total_o1(keranjang, diskon):,.0f}")
+    print(f"Total (O(n)): Rp {hitung_total_on(items, diskon):,.0f}")
+
+# Benchmark waktu start-up berdasarkan output -X importtime
+# Modul yang dulu di-import di tingkat atas script ini (versi eager). Setiap script yang diukur
+# dengan --importtime mendefinisikan IMPOR_EAGER miliknya sendiri (lihat juga media.py)
+IMPOR_EAGER = ["numpy", "pandas", "matplotlib.pyplot", "tabulate", "subprocess", "concurrent.futures"]
+
+def baca_impor_eager(path):
+    """Membaca daftar IMPOR_EAGER dari sebuah script tanpa menjalankannya"""
+    import ast
+    with open(path, encoding="utf-8") as f:
+        pohon = ast.parse(f.read(), path)
+    for node in pohon.body:
+        if isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == "IMPOR_EAGER" for t in node.targets):
+            return list(ast.literal_eval(node.value))
+    raise ValueError(f"{path} tidak mendefinisikan IMPOR_EAGER; berikan impor_eager secara eksplisit")
+
+def _jalankan_importtime(perintah, ulangan, teratas):
+    """
+    Menjalankan `python -X importtime <perintah>` beberapa kali dan menjumlahkan
+    waktu kumulatif import tingkat atas (mikrodetik) dari stderr.
+    """
+    import subprocess
+    total_import = []
+    total_proses = []
+    modul_terberat = {}
+    for _ in range(ulangan):
+        mulai = time.perf_counter_ns()
+        proses = subprocess.run([sys.executable, "-X", "importtime", *perintah],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                stdin=subprocess.DEVNULL, text=True)
+        total_proses.append((time.perf_counter_ns() - mulai) / 1000)
+        
+        jumlah = 0
+        for baris in proses.stderr.splitlines():
+            if not baris.startswith("import time:") or "cumulative" in baris:
+                continue
+            _, kumulatif, nama = baris[len("import time:"):].split("|")
+            # Nama modul tanpa indentasi berarti import tingkat atas
+            if nama.startswith(" ") and not nama.startswith("  "):
+                jumlah += int(kumulatif)
+                nama = nama.strip()
+                modul_terberat[nama] = max(modul_terberat.get(nama, 0), int(kumulatif))
+        total_import.append(jumlah)
+    
+    return {
+        "import_us": statistics.median(total_import),
+        "proses_us": statistics.median(total_proses),
+        "modul_terberat": sorted(modul_terberat.items(), key=lambda x: -x[1])[:teratas],
+    }
+
+def ukur_waktu_impor(argumen_script, ulangan=5, teratas=5, impor_eager=None):
+    """
+    Membandingkan waktu start-up script (argumen_script[0] adalah path script) dalam dua versi:
+    - eager: modul impor_eager (default IMPOR_EAGER milik script yang diukur) di-import dulu, lalu script dijalankan
+      dengan runpy, seperti ketika semua import masih ada di tingkat atas
+    - lazy: script dijalankan apa adanya
+    Mengembalikan {"eager": ..., "lazy": ...}, masing-masing berisi median total waktu import,
+    median waktu proses, dan modul terberat.
+    """
+    if impor_eager is None:
+        impor_eager = baca_impor_eager(argumen_script[0])
+    # Modul yang tidak terpasang dilewati agar versi eager tetap bisa berjalan
+    skrip_eager = "".join(f"try:\n    import {modul}\nexcept ImportError:\n    pass\n" for modul in impor_eager)
+    skrip_eager += ("import runpy, sys\n"
+                    f"sys.argv = {list(argumen_script)!r}\n"
+                    "runpy.run_path(sys.argv[0], run_name='__main__')\n")
+    return {
+        "eager": _jalankan_importtime(["-c", skrip_eager], ulangan, teratas),
+        "lazy": _jalankan_importtime(list(argumen_script), ulangan, teratas),
+    }
+
+def tampilkan_waktu_impor(hasil):
+    eager, lazy = hasil["eager"], hasil["lazy"]
+    print(f"{'':<20}{'Eager':>12}{'Lazy':>12}")
+    print(f"{'Total waktu import':<20}{eager['import_us'] / 1000:>9,.1f} ms{lazy['import_us'] / 1000:>9,.1f} ms")
+    print(f"{'Total waktu proses':<20}{eager['proses_us'] / 1000:>9,.1f} ms{lazy['proses_us'] / 1000:>9,.1f} ms")
+    for versi in ("eager", "lazy"):
+        print(f"Modul terberat ({versi}):")
+        for nama, waktu in hasil[versi]["modul_terberat"]:
+            print(f"  {nama:<30}{waktu / 1000:>10,.1f} ms")
 
 # Fungsi utama
 def main():
+    import pandas as pd
+    import matplotlib.pyplot as plt
+    from tabulate import tabulate
+    
     # Simulasi pembelian
     print("\n===== SIMULASI PROGRAM KASIR =====")
     jumlah_item = int(input("Masukkan jumlah barang (contoh: 5): ") or "5")
@@ -156,17 +611,14 @@ def main():
     # Hitung dan tampilkan total dengan ketiga metode
     print("\n===== PERBANDINGAN METODE PERHITUNGAN =====")
     
-    start = time.time()
     total_o1 = hitung_total_o1(items, diskon)
-    waktu_o1 = time.time() - start
+    waktu_o1 = ringkas_sampel(ukur_fungsi(hitung_total_o1, items, diskon))["median_ns"] / 1e9
     
-    start = time.time()
     total_on = hitung_total_on(items, diskon)
-    waktu_on = time.time() - start
+    waktu_on = ringkas_sampel(ukur_fungsi(hitung_total_on, items, diskon))["median_ns"] / 1e9
     
-    start = time.time()
     total_on2 = hitung_total_on2(items, diskon)
-    waktu_on2 = time.time() - start
+    waktu_on2 = ringkas_sampel(ukur_fungsi(hitung_total_on2, items, diskon))["median_ns"] / 1e9
     
     print(f"Total (O(1)): Rp {total_o1:,.0f} - Waktu: {waktu_o1:.6f} detik")
     print(f"Total (O(n)): Rp {total_on:,.0f} - Waktu: {waktu_on:.6f} detik")
@@ -202,4 +654,21 @@ def main():
     print("5. Namun untuk jumlah item yang besar, perbedaannya sangat nyata")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # python "ALPRO2 QUIZ week6.py" --benchmark [hasil.json|hasil.csv]
+    # python "ALPRO2 QUIZ week6.py" --headless [jumlah_item] [diskon]
+    # python "ALPRO2 QUIZ week6.py" --importtime [script lain beserta argumennya]
+    if len(sys.argv) > 1 and sys.argv[1] == "--headless":
+        jumlah_item = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+        diskon = float(sys.argv[3]) if len(sys.argv) > 3 else 10
+        jalankan_headless(jumlah_item, diskon)
+    elif len(sys.argv) > 1 and sys.argv[1] == "--importtime":
+        argumen_script = sys.argv[2:] or [__file__, "--headless"]
+        tampilkan_waktu_impor(ukur_waktu_impor(argumen_script))
+    elif len(sys.argv) > 1 and sys.argv[1] == "--benchmark":
+        hasil = uji_kinerja_presisi()
+        tampilkan_hasil_kinerja(hasil)
+        if len(sys.argv) > 2:
+            simpan_hasil_kinerja(hasil, sys.argv[2])
+            print(f"Hasil disimpan ke {sys.argv[2]}")
+    else:
+        main()
\ No newline at end of file
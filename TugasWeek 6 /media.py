@@ -1,67 +1,360 @@
 import time
 import random
+import sys
+from array import array
+from bisect import bisect_right
 from collections import defaultdict
-import matplotlib.pyplot as plt
-import numpy as np
+from collections.abc import MutableMapping
+# matplotlib hanya di-import di visualize_results saat grafik diminta, dan asyncio baru
+# di-import oleh Subscription dan benchmark broker, agar jalur notifikasi dan mode headless
+# tidak membayar waktu start-up-nya
+# Modul yang di-import secara lazy di script ini; dibaca oleh --importtime di "ALPRO2 QUIZ week6.py"
+# untuk mengukur versi eager (semua di-import di tingkat atas) terhadap versi lazy
+IMPOR_EAGER = ["asyncio", "matplotlib.pyplot", "numpy", "multiprocessing"]
+
+INTERACTION_TYPES = ['like', 'comment', 'tag', 'share']
+TYPE_CODES = {interaction_type: code for code, interaction_type in enumerate(INTERACTION_TYPES)}
+
+# Interaksi dengan field tetap (__slots__); 'content' adalah properti yang baru dirender saat dibaca.
+# Tetap berperilaku seperti dict (interaction['id'], get, in, items) untuk kode lama
+class Interaction(MutableMapping):
+    __slots__ = ('id', 'sender', 'receiver', 'type', 'timestamp', '_content')
+    FIELDS = ('id', 'sender', 'receiver', 'type', 'timestamp', 'content')
+    
+    def __init__(self, sender, receiver, type, timestamp, id=None, content=None):
+        self.id = id  # None sampai interaksi masuk log
+        self.sender = sender
+        self.receiver = receiver
+        self.type = type
+        self.timestamp = timestamp
+        self._content = content
+    
+    @property
+    def content(self):
+        if self._content is not None:
+            return self._content
+        return f"Interaksi {self.type} dari pengguna {self.sender} ke {self.receiver}"
+    
+    @content.setter
+    def content(self, value):
+        self._content = value
+    
+    def __getitem__(self, key):
+        if key not in self.FIELDS or (key == 'id' and self.id is None):
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __setitem__(self, key, value):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+    
+    def __delitem__(self, key):
+        raise TypeError("Field interaksi tidak bisa dihapus")
+    
+    def __iter__(self):
+        return (key for key in self.FIELDS if key != 'id' or self.id is not None)
+    
+    def __len__(self):
+        return len(self.FIELDS) - (self.id is None)
+    
+    def __repr__(self):
+        return f"Interaction({dict(self)!r})"
+
+# Batch interaksi dalam bentuk kolom NumPy (tanpa membuat dict per interaksi)
+class InteractionBatch:
+    def __init__(self, user_ids, sender_idx, receiver_idx, type_codes, timestamp, first_id=1):
+        self.user_ids = user_ids
+        self.first_id = first_id  # id interaksi pertama, dipakai saat batch dikirim tanpa log
+        self.sender_idx = sender_idx
+        self.receiver_idx = receiver_idx
+        self.type_codes = type_codes
+        self.timestamp = timestamp
+    
+    @property
+    def senders(self):
+        return self.user_ids[self.sender_idx]
+    
+    @property
+    def receivers(self):
+        return self.user_ids[self.receiver_idx]
+    
+    def __len__(self):
+        return len(self.sender_idx)
+    
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        return Interaction(
+            id=self.first_id + i,
+            sender=int(self.user_ids[self.sender_idx[i]]),
+            receiver=int(self.user_ids[self.receiver_idx[i]]),
+            type=INTERACTION_TYPES[self.type_codes[i]],
+            timestamp=self.timestamp
+        )
+    
+    def to_interactions(self):
+        """Mengubah batch menjadi list Interaction dengan id first_id, first_id + 1, ... (log memberi id ulang)"""
+        timestamp = self.timestamp
+        return [
+            Interaction(sender, receiver, INTERACTION_TYPES[code], timestamp, interaction_id)
+            for interaction_id, sender, receiver, code in zip(
+                range(self.first_id, self.first_id + len(self)),
+                self.senders.tolist(), self.receivers.tolist(), self.type_codes.tolist())
+        ]
+
+# Log interaksi append-only dengan id monoton, cursor per konsumen dan indeks sekunder
+class InteractionLog:
+    def __init__(self):
+        self.entries = []  # entries[i] selalu memiliki id i + 1
+        self.by_receiver = defaultdict(list)
+        self.by_type = defaultdict(list)
+        self.cursors = {}  # nama konsumen -> id terakhir yang sudah dibaca
+    
+    @property
+    def last_id(self):
+        return len(self.entries)
+    
+    def append(self, interaction):
+        """Menambahkan interaksi ke akhir log dan memberi id berikutnya"""
+        interaction['id'] = len(self.entries) + 1
+        self.entries.append(interaction)
+        self.by_receiver[interaction['receiver']].append(interaction)
+        self.by_type[interaction['type']].append(interaction)
+        return interaction['id']
+    
+    def extend(self, interactions):
+        for interaction in interactions:
+            self.append(interaction)
+    
+    def get(self, interaction_id):
+        """Interaksi dengan id tertentu, atau None jika id tidak ada di log"""
+        if 1 <= interaction_id <= len(self.entries):
+            return self.entries[interaction_id - 1]
+        return None
+    
+    def read_after(self, after_id, limit=None):
+        """Membaca interaksi dengan id > after_id tanpa memindai riwayat sebelumnya"""
+        end = len(self.entries) if limit is None else min(len(self.entries), after_id + limit)
+        return self.entries[after_id:end]
+    
+    def poll(self, consumer, limit=None):
+        """Membaca interaksi baru untuk satu konsumen lalu memajukan cursor-nya"""
+        cursor = self.cursors.get(consumer, 0)
+        new_entries = self.read_after(cursor, limit)
+        self.cursors[consumer] = cursor + len(new_entries)
+        return new_entries
+    
+    def _after(self, index_list, after_id):
+        # Daftar indeks terurut berdasarkan id, jadi cukup bisect untuk mencari posisi awal
+        # (bisect_right dengan key= membutuhkan Python 3.10+)
+        start = bisect_right(index_list, after_id, key=lambda interaction: interaction['id'])
+        return index_list[start:]
+    
+    def for_receiver(self, receiver, after_id=0):
+        """Interaksi untuk satu penerima dengan id > after_id"""
+        return self._after(self.by_receiver.get(receiver, []), after_id)
+    
+    def for_type(self, interaction_type, after_id=0):
+        """Interaksi dengan satu tipe dengan id > after_id"""
+        return self._after(self.by_type.get(interaction_type, []), after_id)
+    
+    def __len__(self):
+        return len(self.entries)
+
+# Ring buffer notifikasi milik satu pengguna (kolom array, bukan dict per notifikasi)
+class _UserRing:
+    __slots__ = ('ids', 'types', 'counts', 'times', 'start', 'size')
+    
+    def __init__(self, capacity):
+        self.ids = array('q', bytes(8 * capacity))
+        self.types = array('b', bytes(capacity))
+        self.counts = array('l', bytes(array('l').itemsize * capacity))
+        self.times = array('d', bytes(8 * capacity))
+        self.start = 0
+        self.size = 0
+
+# Inbox notifikasi per pengguna yang terbatas dan ringkas
+class NotificationInbox:
+    """
+    Setiap notifikasi disimpan sebagai record (id interaksi, kode tipe, jumlah, timestamp)
+    yang menunjuk ke interaksi di log, bukan salinan content-nya.
+    - capacity   : jumlah record maksimum per pengguna (ring buffer, record terlama ditimpa)
+    - ttl        : umur maksimum record dalam detik (None = tanpa batas)
+    - collapse_likes : like berturut-turut digabung menjadi satu record ("X dan 12 lainnya...")
+    """
+    LIKE_CODE = TYPE_CODES['like']
+    
+    def __init__(self, log=None, capacity=50, ttl=None, collapse_likes=True):
+        self.log = log
+        self.capacity = capacity
+        self.ttl = ttl
+        self.collapse_likes = collapse_likes
+        self._rings = {}
+        self.evicted = 0
+        self.expired = 0
+        self.collapsed = 0
+    
+    def _drop_expired(self, ring, now):
+        limit = now - self.ttl
+        capacity = self.capacity
+        while ring.size and ring.times[ring.start] < limit:
+            ring.start = (ring.start + 1) % capacity
+            ring.size -= 1
+            self.expired += 1
+    
+    def push(self, user, interaction_id, type_code, timestamp):
+        """Menambahkan satu notifikasi untuk pengguna (O(1))"""
+        ring = self._rings.get(user)
+        if ring is None:
+            ring = self._rings[user] = _UserRing(self.capacity)
+        if self.ttl is not None:
+            self._drop_expired(ring, timestamp)
+        
+        capacity = self.capacity
+        if ring.size:
+            last = (ring.start + ring.size - 1) % capacity
+            like = self.LIKE_CODE
+            if self.collapse_likes and type_code == like and ring.types[last] == like:
+                # Gabungkan dengan like sebelumnya; record menunjuk ke like terbaru
+                ring.ids[last] = interaction_id
+                ring.counts[last] += 1
+                ring.times[last] = timestamp
+                self.collapsed += 1
+                return
+        if ring.size == capacity:
+            ring.start = (ring.start + 1) % capacity
+            ring.size -= 1
+            self.evicted += 1
+        
+        index = (ring.start + ring.size) % capacity
+        ring.ids[index] = interaction_id
+        ring.types[index] = type_code
+        ring.counts[index] = 1
+        ring.times[index] = timestamp
+        ring.size += 1
+    
+    def deliver(self, interaction, timestamp=None):
+        """Menambahkan notifikasi dari dict interaksi"""
+        self.push(interaction['receiver'], interaction['id'], TYPE_CODES[interaction['type']],
+                  interaction['timestamp'] if timestamp is None else timestamp)
+    
+    def records(self, user, now=None):
+        """Daftar record (id, tipe, jumlah, timestamp) milik pengguna, dari yang terlama"""
+        ring = self._rings.get(user)
+        if ring is None:
+            return []
+        if self.ttl is not None:
+            self._drop_expired(ring, time.time() if now is None else now)
+        result = []
+        for offset in range(ring.size):
+            index = (ring.start + offset) % self.capacity
+            result.append((ring.ids[index], INTERACTION_TYPES[ring.types[index]], ring.counts[index], ring.times[index]))
+        return result
+    
+    def render(self, user, now=None):
+        """Teks notifikasi pengguna; content dibaca dari log lewat id interaksi"""
+        lines = []
+        for interaction_id, interaction_type, count, _ in self.records(user, now):
+            # Id yang tidak (lagi) ada di log ditampilkan tanpa content
+            interaction = self.log.get(interaction_id) if self.log is not None else None
+            if interaction is None:
+                lines.append(f"Interaksi {interaction_type} #{interaction_id}" + (f" (x{count})" if count > 1 else ""))
+            elif count > 1:
+                lines.append(f"Pengguna {interaction['sender']} dan {count - 1} lainnya menyukai postingan Anda")
+            else:
+                lines.append(interaction['content'])
+        return lines
+    
+    def expire(self, now=None):
+        """Membuang record yang melewati TTL dari semua pengguna"""
+        if self.ttl is None:
+            return 0
+        now = time.time() if now is None else now
+        before = self.expired
+        for ring in self._rings.values():
+            self._drop_expired(ring, now)
+        return self.expired - before
+    
+    def memory_bytes(self):
+        """Perkiraan memori yang dipakai inbox (array, objek ring dan dict pengguna)"""
+        total = sys.getsizeof(self._rings)
+        for ring in self._rings.values():
+            total += sys.getsizeof(ring) + sum(sys.getsizeof(column) for column in (ring.ids, ring.types, ring.counts, ring.times))
+        return total
+    
+    def __len__(self):
+        return sum(ring.size for ring in self._rings.values())
 
 # Simulasi database untuk menyimpan interaksi dan pengguna
 class SocialMediaDatabase:
-    def __init__(self):
-        self.interactions = []
+    def __init__(self, inbox_capacity=50, inbox_ttl=None):
+        self.log = InteractionLog()
         self.users = set(range(1, 1001))  # 1000 pengguna
         self.user_notifications = defaultdict(list)
+        self.inbox = NotificationInbox(self.log, capacity=inbox_capacity, ttl=inbox_ttl)
     
-    def generate_random_interactions(self, num_interactions):
-        """Menghasilkan interaksi acak antara pengguna"""
-        new_interactions = []
-        for _ in range(num_interactions):
-            sender = random.choice(list(self.users))
-            receiver = random.choice(list(self.users - {sender}))
-            interaction_type = random.choice(['like', 'comment', 'tag', 'share'])
-            timestamp = time.time()
-            
-            interaction = {
-                'id': len(self.interactions) + len(new_interactions) + 1,
-                'sender': sender,
-                'receiver': receiver,
-                'type': interaction_type,
-                'timestamp': timestamp,
-                'content': f"Interaksi {interaction_type} dari pengguna {sender} ke {receiver}"
-            }
-            new_interactions.append(interaction)
-        
-        self.interactions.extend(new_interactions)
+    @property
+    def interactions(self):
+        # Tetap tersedia sebagai list (read-only) untuk kode lama
+        return self.log.entries
+    
+    def generate_interaction_batch(self, num_interactions, seed=None):
+        """
+        Menghasilkan interaksi acak sebagai kolom NumPy dalam satu kali undian.
+        Penerima diundi dari U-1 pengguna lalu indeks >= pengirim digeser satu,
+        sehingga tidak ada self-loop tanpa perlu pengurangan set per interaksi.
+        Batch tidak dimasukkan ke log (cocok untuk load test 10^7 interaksi).
+        """
+        import numpy as np
+        
+        if len(self.users) < 2:
+            raise ValueError("Minimal dibutuhkan 2 pengguna untuk membuat interaksi")
+        rng = np.random.default_rng(random.getrandbits(64) if seed is None else seed)
+        user_ids = np.fromiter(sorted(self.users), dtype=np.int64, count=len(self.users))
+        
+        sender_idx = rng.integers(0, len(user_ids), size=num_interactions, dtype=np.int32)
+        receiver_idx = rng.integers(0, len(user_ids) - 1, size=num_interactions, dtype=np.int32)
+        receiver_idx += receiver_idx >= sender_idx
+        type_codes = rng.integers(0, len(INTERACTION_TYPES), size=num_interactions, dtype=np.int8)
+        return InteractionBatch(user_ids, sender_idx, receiver_idx, type_codes, time.time())
+    
+    def generate_random_interactions(self, num_interactions, seed=None):
+        """Menghasilkan interaksi acak antara pengguna dan menyimpannya di log"""
+        new_interactions = self.generate_interaction_batch(num_interactions, seed).to_interactions()
+        self.log.extend(new_interactions)
         return new_interactions
 
 # Implementasi Solusi Buruk: O(n) - Polling Linier
 class PollingNotificationSystem:
-    def __init__(self, database):
+    def __init__(self, database, consumer=None):
         self.database = database
         self.last_check_time = time.time()
-        self.processed_ids = set()
+        # Cukup satu cursor (id terakhir) per konsumen, bukan set semua id yang sudah diproses.
+        # Tanpa nama konsumen setiap instance memakai cursor sendiri; beri nama yang sama
+        # hanya jika beberapa instance memang harus berbagi posisi baca
+        self.consumer = f"polling-{id(self)}" if consumer is None else consumer
     
     def check_notifications(self):
-        """Melakukan polling untuk menemukan interaksi baru (O(n))"""
+        """Melakukan polling untuk interaksi baru sejak cursor terakhir (O(jumlah interaksi baru))"""
         start_time = time.time()
         
         notifications_sent = 0
         interactions_checked = 0
         
-        # Memeriksa semua interaksi (kompleksitas O(n))
-        for interaction in self.database.interactions:
+        # Hanya membaca interaksi setelah cursor konsumen ini
+        for interaction in self.database.log.poll(self.consumer):
             interactions_checked += 1
             
-            # Hanya memproses interaksi yang belum diproses
-            if interaction['id'] not in self.processed_ids:
-                # Simulasi pengiriman notifikasi ke penerima
-                self.database.user_notifications[interaction['receiver']].append({
-                    'interaction_id': interaction['id'],
-                    'content': interaction['content'],
-                    'timestamp': time.time()
-                })
-                
-                self.processed_ids.add(interaction['id'])
-                notifications_sent += 1
+            # Simulasi pengiriman notifikasi ke penerima
+            self.database.user_notifications[interaction['receiver']].append({
+                'interaction_id': interaction['id'],
+                'content': interaction['content'],
+                'timestamp': time.time()
+            })
+            notifications_sent += 1
+        
+        self.last_check_time = time.time()
         
         processing_time = time.time() - start_time
         return {
@@ -70,26 +363,357 @@ class PollingNotificationSystem:
             'interactions_checked': interactions_checked
         }
 
+# Broker pub/sub asyncio di dalam proses
+QUEUE_POLICIES = ('block', 'drop_newest', 'drop_oldest')
+_CLOSED = object()  # penanda akhir stream untuk subscriber
+
+def user_topic(user):
+    return f"user:{user}"
+
+def type_topic(interaction_type):
+    return f"type:{interaction_type}"
+
+class Subscription:
+    """
+    Satu subscriber dengan antrean terbatas miliknya sendiri.
+    Kebijakan saat antrean penuh:
+      'block'       : publisher menunggu sampai ada ruang (backpressure)
+      'drop_newest' : pesan baru dibuang
+      'drop_oldest' : pesan terlama dibuang untuk memberi ruang pesan baru
+    """
+    def __init__(self, broker, topics, maxsize, policy):
+        if policy not in QUEUE_POLICIES:
+            raise ValueError(f"Kebijakan antrean tidak dikenal: {policy}")
+        import asyncio
+        self.broker = broker
+        self.topics = set(topics)
+        self.queue = asyncio.Queue(maxsize)
+        self.policy = policy
+        self.dropped = 0
+        self.closed = False
+    
+    async def put(self, message):
+        if self.policy == 'block':
+            await self.queue.put(message)
+        else:
+            self.put_nowait(message)
+    
+    def put_nowait(self, message):
+        """Versi tanpa menunggu; subscriber 'block' dengan antrean penuh melempar asyncio.QueueFull"""
+        if self.policy == 'block' or not self.queue.full():
+            self.queue.put_nowait(message)
+        else:
+            self.dropped += 1
+            if self.policy == 'drop_oldest':
+                self.queue.get_nowait()
+                self.queue.put_nowait(message)
+    
+    async def get(self):
+        """Mengambil pesan berikutnya; StopAsyncIteration jika subscription sudah ditutup"""
+        message = await self.queue.get()
+        if message is _CLOSED:
+            raise StopAsyncIteration
+        return message
+    
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self):
+        return await self.get()
+    
+    async def close(self):
+        """Berhenti berlangganan dan memberi tahu consumer bahwa stream selesai"""
+        if self.closed:
+            return
+        self.closed = True
+        self.broker.unsubscribe(self)
+        # Penanda penutup tidak boleh dibuang. Subscriber 'block' menunggu ruang kosong;
+        # subscriber drop_* yang antreannya penuh membuang satu pesan agar close tidak menggantung
+        if self.policy != 'block' and self.queue.full():
+            self.dropped += 1
+            if self.policy == 'drop_oldest':
+                self.queue.get_nowait()
+                self.queue.put_nowait(_CLOSED)
+            else:
+                self._replace_newest(_CLOSED)
+        else:
+            await self.queue.put(_CLOSED)
+    
+    def _replace_newest(self, message):
+        # Buang pesan terbaru (ujung antrean) lalu masukkan message, urutan pesan lain tetap
+        remaining = [self.queue.get_nowait() for _ in range(self.queue.qsize())][:-1]
+        for item in remaining:
+            self.queue.put_nowait(item)
+        self.queue.put_nowait(message)
+
+class AsyncPubSubBroker:
+    def __init__(self, maxsize=1000, policy='block'):
+        self.maxsize = maxsize
+        self.policy = policy
+        self.subscribers = defaultdict(list)  # topic -> daftar Subscription
+        self.published = 0
+    
+    def subscribe(self, *topics, maxsize=None, policy=None):
+        """Membuat subscription untuk satu atau beberapa topic"""
+        subscription = Subscription(self, topics, self.maxsize if maxsize is None else maxsize,
+                                    self.policy if policy is None else policy)
+        for topic in subscription.topics:
+            self.subscribers[topic].append(subscription)
+        return subscription
+    
+    def unsubscribe(self, subscription):
+        for topic in subscription.topics:
+            subscribers = self.subscribers.get(topic)
+            if subscribers and subscription in subscribers:
+                subscribers.remove(subscription)
+                if not subscribers:
+                    del self.subscribers[topic]
+    
+    def _targets(self, topics):
+        # Subscriber yang berlangganan beberapa topic yang cocok hanya dihitung sekali
+        if isinstance(topics, str):
+            return list(self.subscribers.get(topics, ()))
+        targets = {}
+        for topic in topics:
+            for subscription in self.subscribers.get(topic, ()):
+                targets[id(subscription)] = subscription
+        return list(targets.values())
+    
+    async def publish(self, topics, message):
+        """
+        Mengirim pesan ke semua subscriber dari topic (string) atau daftar topic.
+        Subscriber yang berlangganan beberapa topic yang cocok hanya menerima satu salinan.
+        Mengembalikan jumlah subscriber yang dituju.
+        """
+        self.published += 1
+        targets = self._targets(topics)
+        for subscription in targets:
+            await subscription.put(message)
+        return len(targets)
+    
+    def publish_nowait(self, topics, message):
+        """
+        publish untuk pemanggil sinkron. Tidak bisa menunggu backpressure, jadi subscriber
+        'block' yang antreannya penuh membuat asyncio.QueueFull dilempar.
+        """
+        self.published += 1
+        if not self.subscribers:
+            return 0
+        targets = self._targets(topics)
+        for subscription in targets:
+            subscription.put_nowait(message)
+        return len(targets)
+    
+    @staticmethod
+    def _interaction_topics(interaction):
+        return (user_topic(interaction['receiver']), type_topic(interaction['type']))
+    
+    async def publish_interaction(self, interaction, message=None):
+        """Mengirim interaksi ke topic penerima dan topic tipe interaksinya"""
+        return await self.publish(self._interaction_topics(interaction),
+                                  interaction if message is None else message)
+    
+    def publish_interaction_nowait(self, interaction, message=None):
+        """Versi sinkron publish_interaction (lihat publish_nowait)"""
+        if not self.subscribers:
+            self.published += 1
+            return 0
+        return self.publish_nowait(self._interaction_topics(interaction),
+                                   interaction if message is None else message)
+    
+    async def close(self):
+        """Menutup semua subscription yang masih aktif"""
+        subscriptions = {}
+        for subscribers in self.subscribers.values():
+            for subscription in subscribers:
+                subscriptions[id(subscription)] = subscription
+        for subscription in subscriptions.values():
+            await subscription.close()
+
+# Fan-out notifikasi yang di-shard ke beberapa proses berdasarkan hash id penerima
+def shard_of(receiver, num_shards):
+    return receiver % num_shards
+
+def _shard_worker(shard_index, commands, results):
+    """
+    Proses pekerja yang memiliki satu shard user_notifications.
+    Shard menyimpan daftar id interaksi per pengguna (ringkas); isi notifikasi
+    dapat dibaca ulang dari log berdasarkan id tersebut.
+    """
+    import numpy as np
+    from multiprocessing import shared_memory
+    
+    # Python 3.13+: blok milik proses utama tidak perlu didaftarkan ke resource tracker pekerja
+    attach_options = {'track': False} if sys.version_info >= (3, 13) else {}
+    notifications = defaultdict(list)
+    while True:
+        command = commands.get()
+        kind = command[0]
+        if kind == 'items':
+            # Batch kecil (misalnya satu interaksi) dikirim langsung lewat antrean, urutannya tetap FIFO
+            for interaction_id, receiver in zip(command[1], command[2]):
+                notifications[receiver].append(interaction_id)
+        elif kind == 'batch':
+            _, name, total, start, end = command
+            block = shared_memory.SharedMemory(name=name, **attach_options)
+            try:
+                ids = np.ndarray((total,), dtype=np.int64, buffer=block.buf)[start:end].copy()
+                receivers = np.ndarray((total,), dtype=np.int64, buffer=block.buf, offset=total * 8)[start:end].copy()
+            finally:
+                block.close()
+            results.put(('ack', shard_index))
+            if len(ids) == 0:
+                continue
+            # Urutkan stabil per penerima agar urutan per pengguna tetap terjaga
+            order = np.argsort(receivers, kind='stable')
+            receivers = receivers[order]
+            ids = ids[order]
+            boundaries = np.flatnonzero(np.diff(receivers)) + 1
+            starts = [0, *boundaries.tolist()]
+            ends = [*boundaries.tolist(), len(ids)]
+            receiver_list = receivers[starts].tolist()
+            id_list = ids.tolist()
+            for receiver, a, b in zip(receiver_list, starts, ends):
+                notifications[receiver].extend(id_list[a:b])
+        elif kind == 'sync':
+            results.put(('ack', shard_index))
+        elif kind == 'get':
+            results.put(('user', list(notifications.get(command[1], []))))
+        elif kind == 'dump':
+            results.put(('dump', dict(notifications)))
+        elif kind == 'stop':
+            break
+
+class ShardedNotificationRouter:
+    """
+    Membagi pengguna ke num_shards proses berdasarkan hash id penerima.
+    Setiap batch diurutkan (stabil) per shard dan ditulis sekali ke blok shared memory
+    yang dipakai ulang; setiap shard hanya menerima nama blok dan rentang miliknya lewat
+    antrean perintah. Batch kecil (<= inline_limit) dikirim langsung lewat antrean yang sama,
+    sehingga urutan notifikasi per pengguna tetap sesuai urutan pengiriman.
+    """
+    def __init__(self, num_shards, inline_limit=256, initial_capacity=65536):
+        import multiprocessing
+        from multiprocessing import shared_memory
+        
+        # Blok staging dibuat sebelum pekerja dibuat, sehingga pekerja mewarisi resource tracker
+        # proses utama; blok hanya dibuat dan di-unlink oleh proses utama
+        self.block = shared_memory.SharedMemory(create=True, size=initial_capacity * 16)
+        self.capacity = initial_capacity
+        self.inline_limit = inline_limit
+        self.num_shards = num_shards
+        self.results = multiprocessing.Queue()
+        self.commands = []
+        self.workers = []
+        for shard_index in range(num_shards):
+            commands = multiprocessing.Queue()
+            worker = multiprocessing.Process(target=_shard_worker, args=(shard_index, commands, self.results), daemon=True)
+            worker.start()
+            self.commands.append(commands)
+            self.workers.append(worker)
+    
+    def route(self, ids, receivers):
+        """Mengirim satu batch (array id dan penerima) ke semua shard dan menunggu hingga diterima"""
+        import numpy as np
+        from multiprocessing import shared_memory
+        
+        total = len(ids)
+        if total <= self.inline_limit:
+            ids, receivers = np.asarray(ids).tolist(), np.asarray(receivers).tolist()
+            per_shard = defaultdict(lambda: ([], []))
+            for interaction_id, receiver in zip(ids, receivers):
+                shard_ids, shard_receivers = per_shard[shard_of(receiver, self.num_shards)]
+                shard_ids.append(interaction_id)
+                shard_receivers.append(receiver)
+            for shard_index, (shard_ids, shard_receivers) in per_shard.items():
+                self.commands[shard_index].put(('items', shard_ids, shard_receivers))
+            return
+        
+        shards = shard_of(receivers, self.num_shards)
+        order = np.argsort(shards, kind='stable')
+        counts = np.bincount(shards, minlength=self.num_shards)
+        offsets = np.concatenate(([0], np.cumsum(counts)))
+        
+        if total > self.capacity:
+            # Blok lama tidak dipakai lagi oleh shard (route selalu menunggu ack), jadi aman diganti
+            self.block.close()
+            self.block.unlink()
+            self.capacity = max(total, self.capacity * 2)
+            self.block = shared_memory.SharedMemory(create=True, size=self.capacity * 16)
+        
+        block = self.block
+        np.ndarray((total,), dtype=np.int64, buffer=block.buf)[:] = ids[order]
+        np.ndarray((total,), dtype=np.int64, buffer=block.buf, offset=total * 8)[:] = receivers[order]
+        for shard_index, commands in enumerate(self.commands):
+            commands.put(('batch', block.name, total, int(offsets[shard_index]), int(offsets[shard_index + 1])))
+        # Blok staging baru boleh ditulis ulang setelah semua shard menyalin bagiannya
+        for _ in range(self.num_shards):
+            self.results.get()
+    
+    def route_one(self, interaction_id, receiver):
+        """Mengirim satu notifikasi ke shard pemilik penerima (lewat antrean yang sama dengan batch)"""
+        self.commands[shard_of(receiver, self.num_shards)].put(('items', [interaction_id], [receiver]))
+    
+    def flush(self):
+        """Menunggu sampai semua batch yang sudah dikirim selesai diproses oleh setiap shard"""
+        for commands in self.commands:
+            commands.put(('sync',))
+        for _ in range(self.num_shards):
+            self.results.get()
+    
+    def get_notifications(self, user):
+        """Daftar id interaksi untuk satu pengguna, sesuai urutan pengiriman"""
+        self.commands[shard_of(user, self.num_shards)].put(('get', user))
+        return self.results.get()[1]
+    
+    def collect(self):
+        """Menggabungkan semua shard menjadi satu dict pengguna -> daftar id interaksi"""
+        merged = {}
+        for commands in self.commands:
+            commands.put(('dump',))
+            merged.update(self.results.get()[1])
+        return merged
+    
+    def shutdown(self):
+        for commands in self.commands:
+            commands.put(('stop',))
+        for worker in self.workers:
+            worker.join()
+        self.block.close()
+        self.block.unlink()
+
 # Implementasi Solusi Baik: O(1) - Sistem Pub/Sub
 class PubSubNotificationSystem:
-    def __init__(self, database):
+    def __init__(self, database, broker=None, shards=None, use_inbox=False):
         self.database = database
+        # use_inbox: notifikasi disimpan di database.inbox (ringkas, terbatas) alih-alih dict per notifikasi
+        self.use_inbox = use_inbox
         self.subscription_channels = defaultdict(set)
+        self.broker = broker or AsyncPubSubBroker()
+        # Mode shard: notifikasi dikirim ke proses pekerja, bukan ke database.user_notifications
+        self.router = ShardedNotificationRouter(shards) if shards else None
         
         # Setiap pengguna berlangganan ke saluran notifikasinya sendiri
         for user in self.database.users:
-            self.subscription_channels[user].add(user)
+            self.subscription_channels[user].add(user_topic(user))
     
     def process_new_interaction(self, interaction):
         """Memproses satu interaksi baru dan mengirim notifikasi (O(1))"""
         start_time = time.time()
         
-        # Langsung kirim notifikasi ke penerima (kompleksitas O(1))
-        self.database.user_notifications[interaction['receiver']].append({
-            'interaction_id': interaction['id'],
-            'content': interaction['content'],
-            'timestamp': time.time()
-        })
+        # Langsung kirim notifikasi ke penerima (kompleksitas O(1)) dan teruskan ke subscriber broker
+        self.broker.publish_interaction_nowait(interaction)
+        if self.router is not None:
+            # Mode shard: lewat shard pemilik agar urutan dengan batch sebelumnya tetap terjaga
+            self.router.route_one(interaction['id'], interaction['receiver'])
+        elif self.use_inbox:
+            self.database.inbox.deliver(interaction, time.time())
+        else:
+            self.database.user_notifications[interaction['receiver']].append({
+                'interaction_id': interaction['id'],
+                'content': interaction['content'],
+                'timestamp': time.time()
+            })
         
         processing_time = time.time() - start_time
         return {
@@ -100,6 +724,9 @@ class PubSubNotificationSystem:
     
     def process_batch_interactions(self, interactions):
         """Memproses batch interaksi baru untuk pengujian performa"""
+        if self.router is not None:
+            return self._process_batch_sharded(interactions)
+        
         total_time = 0
         for interaction in interactions:
             result = self.process_new_interaction(interaction)
@@ -111,6 +738,199 @@ class PubSubNotificationSystem:
             'interactions_checked': len(interactions)
         }
 
+    def _process_batch_sharded(self, interactions):
+        import numpy as np
+        
+        start_time = time.time()
+        # Subscriber broker juga menerima interaksi dari jalur batch, seperti di process_new_interaction;
+        # tanpa subscriber cukup menambah hitungan agar batch besar tidak diubah menjadi objek satu per satu
+        if self.broker.subscribers:
+            if isinstance(interactions, InteractionBatch):
+                interactions = interactions.to_interactions()
+            for interaction in interactions:
+                self.broker.publish_interaction_nowait(interaction)
+        else:
+            self.broker.published += len(interactions)
+        if isinstance(interactions, InteractionBatch):
+            ids = np.arange(interactions.first_id, interactions.first_id + len(interactions), dtype=np.int64)
+            receivers = interactions.receivers.astype(np.int64)
+        else:
+            ids = np.fromiter((interaction['id'] for interaction in interactions), dtype=np.int64, count=len(interactions))
+            receivers = np.fromiter((interaction['receiver'] for interaction in interactions), dtype=np.int64, count=len(interactions))
+        self.router.route(ids, receivers)
+        
+        return {
+            'processing_time': time.time() - start_time,
+            'notifications_sent': len(interactions),
+            'interactions_checked': len(interactions)
+        }
+    
+    def shutdown(self):
+        """Menghentikan proses pekerja shard (jika mode shard aktif)"""
+        if self.router is not None:
+            self.router.shutdown()
+            self.router = None
+    
+    async def _consume(self, user, subscription):
+        async for interaction in subscription:
+            self.database.user_notifications[user].append({
+                'interaction_id': interaction['id'],
+                'content': interaction['content'],
+                'timestamp': time.time()
+            })
+    
+    async def deliver_async(self, interactions):
+        """
+        Mengirim batch interaksi lewat broker asyncio: setiap pengguna punya consumer
+        sendiri yang berlangganan ke subscription_channels miliknya.
+        """
+        import asyncio
+        subscriptions = [(user, self.broker.subscribe(*topics)) for user, topics in self.subscription_channels.items()]
+        consumers = [asyncio.create_task(self._consume(user, subscription)) for user, subscription in subscriptions]
+        for interaction in interactions:
+            await self.broker.publish_interaction(interaction)
+        # Hanya subscription milik pemanggilan ini yang ditutup; subscriber lain di broker tetap aktif
+        for _, subscription in subscriptions:
+            await subscription.close()
+        await asyncio.gather(*consumers)
+        return {'notifications_sent': len(interactions)}
+
+# Benchmark beban broker: laju publish dan latensi pengiriman end-to-end
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q / 100 * len(sorted_values)))]
+
+async def _broker_benchmark(num_subscribers, num_messages, type_subscribers, maxsize, policy, yield_every, seed):
+    import asyncio
+    db = SocialMediaDatabase()
+    db.users = set(range(1, num_subscribers + 1))
+    batch = db.generate_interaction_batch(num_messages, seed=seed)
+    receivers = batch.receivers.tolist()
+    types = [INTERACTION_TYPES[code] for code in batch.type_codes.tolist()]
+    
+    broker = AsyncPubSubBroker(maxsize=maxsize, policy=policy)
+    latencies = []
+    
+    async def consume(subscription):
+        async for published_ns, _ in subscription:
+            latencies.append(time.perf_counter_ns() - published_ns)
+    
+    subscriptions = [broker.subscribe(user_topic(user)) for user in db.users]
+    # Beberapa consumer tambahan per tipe untuk menguji fan-out ke banyak subscriber
+    for _ in range(type_subscribers):
+        for interaction_type in INTERACTION_TYPES:
+            subscriptions.append(broker.subscribe(type_topic(interaction_type)))
+    consumers = [asyncio.create_task(consume(subscription)) for subscription in subscriptions]
+    
+    start = time.perf_counter_ns()
+    for i in range(num_messages):
+        await broker.publish((user_topic(receivers[i]), type_topic(types[i])), (time.perf_counter_ns(), i))
+        if i % yield_every == 0:
+            await asyncio.sleep(0)
+    publish_ns = time.perf_counter_ns() - start
+    await broker.close()
+    await asyncio.gather(*consumers)
+    total_ns = time.perf_counter_ns() - start
+    
+    latencies.sort()
+    return {
+        'subscribers': len(subscriptions),
+        'messages': num_messages,
+        'delivered': len(latencies),
+        'dropped': sum(subscription.dropped for subscription in subscriptions),
+        'publish_rate': num_messages / (publish_ns / 1e9),
+        'delivery_rate': len(latencies) / (total_ns / 1e9),
+        'latency_p50_ms': percentile(latencies, 50) / 1e6,
+        'latency_p95_ms': percentile(latencies, 95) / 1e6,
+        'latency_p99_ms': percentile(latencies, 99) / 1e6,
+    }
+
+def run_broker_benchmark(num_subscribers=5000, num_messages=200000, type_subscribers=2,
+                         maxsize=100, policy='block', yield_every=100, seed=None):
+    """Menjalankan benchmark broker dengan ribuan subscriber yang aktif bersamaan"""
+    import asyncio
+    result = asyncio.run(_broker_benchmark(num_subscribers, num_messages, type_subscribers,
+                                           maxsize, policy, yield_every, seed))
+    print(f"Subscriber          : {result['subscribers']:,d}")
+    print(f"Pesan dipublish     : {result['messages']:,d}")
+    print(f"Pesan terkirim      : {result['delivered']:,d} (dibuang: {result['dropped']:,d})")
+    print(f"Laju publish        : {result['publish_rate']:,.0f} pesan/detik")
+    print(f"Laju pengiriman     : {result['delivery_rate']:,.0f} pesan/detik")
+    print(f"Latensi p50/p95/p99 : {result['latency_p50_ms']:.3f} / {result['latency_p95_ms']:.3f} / {result['latency_p99_ms']:.3f} ms")
+    return result
+
+def run_sharded_benchmark(num_interactions=4_000_000, shards=None, batch_size=500_000, seed=None):
+    """Mengukur throughput fan-out ber-shard untuk volume interaksi yang besar"""
+    import os
+    
+    shards = shards or os.cpu_count()
+    db = SocialMediaDatabase()
+    system = PubSubNotificationSystem(db, shards=shards)
+    try:
+        batches = []
+        for first_id in range(1, num_interactions + 1, batch_size):
+            batch = db.generate_interaction_batch(min(batch_size, num_interactions - first_id + 1), seed=seed)
+            batch.first_id = first_id
+            batches.append(batch)
+        
+        start = time.perf_counter()
+        for batch in batches:
+            system.process_batch_interactions(batch)
+        system.router.flush()
+        elapsed = time.perf_counter() - start
+    finally:
+        system.shutdown()
+    
+    print(f"Shard               : {shards}")
+    print(f"Interaksi           : {num_interactions:,d}")
+    print(f"Waktu               : {elapsed:.3f} detik")
+    print(f"Throughput          : {num_interactions / elapsed:,.0f} notifikasi/detik")
+    return num_interactions / elapsed
+
+def run_inbox_memory_benchmark(num_notifications=10_000_000, num_users=1000, capacity=50, sample_size=100_000, seed=None):
+    """
+    Membandingkan memori inbox ringkas untuk num_notifications notifikasi dengan
+    user_notifications berbasis dict (diukur dengan tracemalloc pada sample lalu diekstrapolasi).
+    """
+    import tracemalloc
+    
+    db = SocialMediaDatabase(inbox_capacity=capacity)
+    db.users = set(range(1, num_users + 1))
+    batch = db.generate_interaction_batch(num_notifications, seed=seed)
+    receivers = batch.receivers.tolist()
+    type_codes = batch.type_codes.tolist()
+    
+    # Inbox ringkas: semua notifikasi dimasukkan
+    start = time.perf_counter()
+    push = db.inbox.push
+    timestamp = batch.timestamp
+    for i in range(num_notifications):
+        push(receivers[i], i + 1, type_codes[i], timestamp)
+    elapsed = time.perf_counter() - start
+    inbox_bytes = db.inbox.memory_bytes()
+    
+    # Cara lama: dict per notifikasi dengan salinan content, diukur pada sample
+    sample_size = min(sample_size, num_notifications)
+    senders = batch.senders[:sample_size].tolist()
+    tracemalloc.start()
+    legacy = defaultdict(list)
+    for i in range(sample_size):
+        legacy[receivers[i]].append({
+            'interaction_id': i + 1,
+            'content': f"Interaksi {INTERACTION_TYPES[type_codes[i]]} dari pengguna {senders[i]} ke {receivers[i]}",
+            'timestamp': time.time()
+        })
+    legacy_bytes = tracemalloc.get_traced_memory()[0] * num_notifications / sample_size
+    tracemalloc.stop()
+    
+    print(f"Notifikasi          : {num_notifications:,d} untuk {num_users:,d} pengguna")
+    print(f"Waktu push inbox    : {elapsed:.2f} detik ({num_notifications / elapsed:,.0f} notifikasi/detik)")
+    print(f"Record tersimpan    : {len(db.inbox):,d} (digabung: {db.inbox.collapsed:,d}, ditimpa: {db.inbox.evicted:,d})")
+    print(f"Memori inbox        : {inbox_bytes / 2**20:,.2f} MiB")
+    print(f"Memori dict (estimasi): {legacy_bytes / 2**20:,.0f} MiB")
+    return {'inbox_bytes': inbox_bytes, 'legacy_bytes': legacy_bytes, 'push_seconds': elapsed}
+
 # Fungsi untuk menjalankan pengujian performa
 def run_performance_test():
     print("Menjalankan Pengujian Performa Sistem Notifikasi Media Sosial...")
@@ -163,7 +983,14 @@ def run_performance_test():
     return results
 
 # Fungsi untuk membuat visualisasi hasil pengujian
-def visualize_results(results):
+def visualize_results(results, save_chart=True):
+    if save_chart:
+        save_chart_image(results)
+    return print_comparison_table(results)
+
+def save_chart_image(results):
+    import matplotlib.pyplot as plt
+    
     # Grafik waktu pemrosesan
     plt.figure(figsize=(14, 7))
     plt.subplot(1, 2, 1)
@@ -188,7 +1015,8 @@ def visualize_results(results):
     plt.tight_layout()
     plt.savefig('perbandingan_kinerja.png')
     plt.close()
-    
+
+def print_comparison_table(results):
     # Buat tabel perbandingan
     print("\n--- Tabel Perbandingan Kinerja ---")
     print("| Jumlah Interaksi | Waktu Polling O(n) | Waktu Pub/Sub O(1) | Rasio Peningkatan |")
@@ -209,7 +1037,7 @@ def visualize_results(results):
     }
 
 # Fungsi utama
-def main():
+def main(headless=False):
     print("=== SISTEM NOTIFIKASI MEDIA SOSIAL: PERBANDINGAN ALGORITMA ===")
     print("Membandingkan kinerja algoritma Polling Linier O(n) vs. Pub/Sub O(1)\n")
     
@@ -217,7 +1045,7 @@ def main():
     results = run_performance_test()
     
     # Visualisasikan hasil
-    table_data = visualize_results(results)
+    table_data = visualize_results(results, save_chart=not headless)
     
     print("\n=== KESIMPULAN ===")
     avg_improvement = sum(table_data['improvement_ratios']) / len(table_data['improvement_ratios'])
@@ -230,4 +1058,15 @@ def main():
     print("\nDisarankan untuk mengimplementasikan sistem notifikasi berbasis Pub/Sub untuk aplikasi media sosial dengan jumlah pengguna dan interaksi yang besar.")
 
 if __name__ == "__main__":
-    main()
+    # python media.py --headless : hanya menghitung dan mencetak tabel, tanpa grafik
+    # python media.py --broker-benchmark [policy] : benchmark beban broker asyncio
+    # python media.py --sharded-benchmark [shards] : benchmark fan-out multi-proses
+    # python media.py --inbox-benchmark : benchmark memori inbox untuk 10^7 notifikasi
+    if len(sys.argv) > 1 and sys.argv[1] == "--broker-benchmark":
+        run_broker_benchmark(policy=sys.argv[2] if len(sys.argv) > 2 else 'block')
+    elif len(sys.argv) > 1 and sys.argv[1] == "--inbox-benchmark":
+        run_inbox_memory_benchmark()
+    elif len(sys.argv) > 1 and sys.argv[1] == "--sharded-benchmark":
+        run_sharded_benchmark(shards=int(sys.argv[2]) if len(sys.argv) > 2 else None)
+    else:
+        main(headless="--headless" in sys.argv[1:])
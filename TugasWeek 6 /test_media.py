@@ -0,0 +1,144 @@
+import asyncio
+
+from media import (
+    TYPE_CODES, AsyncPubSubBroker, Interaction, InteractionLog, NotificationInbox,
+    PollingNotificationSystem, PubSubNotificationSystem, SocialMediaDatabase, type_topic, user_topic
+)
+
+
+def test_dua_polling_pada_database_yang_sama_punya_cursor_sendiri():
+    db = SocialMediaDatabase()
+    pertama = PollingNotificationSystem(db)
+    kedua = PollingNotificationSystem(db)
+    db.generate_random_interactions(1000, seed=1)
+
+    assert pertama.check_notifications()['notifications_sent'] == 1000
+    assert kedua.check_notifications()['notifications_sent'] == 1000
+    assert pertama.check_notifications()['notifications_sent'] == 0
+
+
+def test_polling_dengan_nama_konsumen_sama_berbagi_cursor():
+    db = SocialMediaDatabase()
+    pertama = PollingNotificationSystem(db, consumer='bersama')
+    kedua = PollingNotificationSystem(db, consumer='bersama')
+    db.generate_random_interactions(10, seed=1)
+
+    assert pertama.check_notifications()['notifications_sent'] == 10
+    assert kedua.check_notifications()['notifications_sent'] == 0
+
+
+def test_content_interaksi_sama_untuk_semua_cara_akses():
+    db = SocialMediaDatabase()
+    interaction = db.generate_random_interactions(1, seed=2)[0]
+    expected = f"Interaksi {interaction['type']} dari pengguna {interaction['sender']} ke {interaction['receiver']}"
+
+    assert interaction['content'] == expected
+    assert interaction.get('content') == expected
+    assert interaction.content == expected
+    assert 'content' in interaction
+    assert dict(interaction)['content'] == expected
+    assert expected in repr(interaction)
+
+
+def test_batch_diproses_tanpa_shard():
+    db = SocialMediaDatabase()
+    batch = db.generate_interaction_batch(50, seed=3)
+    system = PubSubNotificationSystem(db)
+
+    assert system.process_batch_interactions(batch)['notifications_sent'] == 50
+    ids = sorted(n['interaction_id'] for notifications in db.user_notifications.values() for n in notifications)
+    assert ids == list(range(batch.first_id, batch.first_id + 50))
+
+
+def test_close_tidak_menggantung_untuk_antrean_drop_yang_penuh():
+    async def skenario():
+        broker = AsyncPubSubBroker()
+        terbaru = broker.subscribe('a', maxsize=2, policy='drop_newest')
+        terlama = broker.subscribe('a', maxsize=2, policy='drop_oldest')
+        for i in range(3):
+            await broker.publish('a', i)
+        await asyncio.wait_for(broker.close(), timeout=1)
+        return [m async for m in terbaru], [m async for m in terlama]
+
+    assert asyncio.run(skenario()) == ([0], [2])
+
+
+def test_deliver_async_hanya_menutup_subscription_miliknya():
+    async def skenario():
+        db = SocialMediaDatabase()
+        db.users = {1, 2}
+        system = PubSubNotificationSystem(db)
+        luar = system.broker.subscribe(user_topic(2))
+        interactions = db.generate_random_interactions(5, seed=4)
+        await system.deliver_async(interactions)
+        return luar, interactions, db
+
+    luar, interactions, db = asyncio.run(skenario())
+    assert not luar.closed
+    assert luar.queue.qsize() == sum(interaction['receiver'] == 2 for interaction in interactions)
+    assert sum(len(n) for n in db.user_notifications.values()) == 5
+
+
+def test_interaksi_tunggal_diteruskan_ke_subscriber():
+    db = SocialMediaDatabase()
+    system = PubSubNotificationSystem(db)
+    subscription = system.broker.subscribe(type_topic('like'), user_topic(7), policy='drop_oldest')
+    interaction = Interaction(sender=1, receiver=7, type='like', timestamp=0.0, id=1)
+    system.process_new_interaction(interaction)
+
+    assert subscription.queue.qsize() == 1
+    assert subscription.queue.get_nowait() is interaction
+
+
+def test_mode_shard_menjaga_urutan_batch_dan_interaksi_tunggal():
+    db = SocialMediaDatabase()
+    db.users = set(range(1, 21))
+    system = PubSubNotificationSystem(db, shards=2)
+    try:
+        expected = {}
+        first_id = 1
+        for size in (5, 1000, 3):
+            batch = db.generate_interaction_batch(size, seed=size)
+            batch.first_id = first_id
+            system.process_batch_interactions(batch)
+            for interaction in batch:
+                expected.setdefault(interaction['receiver'], []).append(interaction['id'])
+            first_id += size
+            single = Interaction(sender=1, receiver=2, type='comment', timestamp=0.0, id=first_id)
+            system.process_new_interaction(single)
+            expected.setdefault(2, []).append(first_id)
+            first_id += 1
+        system.router.flush()
+        assert system.router.collect() == expected
+    finally:
+        system.shutdown()
+
+
+def test_mode_shard_meneruskan_batch_ke_subscriber():
+    db = SocialMediaDatabase()
+    db.users = set(range(1, 21))
+    system = PubSubNotificationSystem(db, shards=2)
+    try:
+        batch = db.generate_interaction_batch(200, seed=5)
+        subscription = system.broker.subscribe(user_topic(3), maxsize=0)
+        system.process_batch_interactions(batch)
+        received = [subscription.queue.get_nowait()['id'] for _ in range(subscription.queue.qsize())]
+        assert received == [interaction['id'] for interaction in batch if interaction['receiver'] == 3]
+        assert system.broker.published == 200
+    finally:
+        system.shutdown()
+
+
+def test_inbox_menggabungkan_like_dan_aman_untuk_id_di_luar_log():
+    log = InteractionLog()
+    for sender in (1, 2, 3):
+        log.append(Interaction(sender=sender, receiver=9, type='like', timestamp=0.0))
+    inbox = NotificationInbox(log)
+    for interaction in log.entries:
+        inbox.deliver(interaction)
+    inbox.push(9, 99, TYPE_CODES['comment'], 0.0)
+
+    assert inbox.render(9) == [
+        "Pengguna 3 dan 2 lainnya menyukai postingan Anda",
+        "Interaksi comment #99",
+    ]
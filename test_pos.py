@@ -0,0 +1,99 @@
+import importlib.util
+import io
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Nama file berisi spasi, jadi dimuat lewat path; didaftarkan di sys.modules agar
+# tulis_struk_massal(workers=...) bisa mem-pickle fungsi pekerjanya
+_spec = importlib.util.spec_from_file_location("pos", Path(__file__).with_name("ALPRO2 QUIZ week6.py"))
+pos = importlib.util.module_from_spec(_spec)
+sys.modules["pos"] = pos
+_spec.loader.exec_module(pos)
+
+
+def subtotal_per_kategori(items):
+    hasil = {}
+    for item in items:
+        hasil[item.kategori] = hasil.get(item.kategori, 0) + item.harga
+    return hasil
+
+
+@pytest.mark.parametrize("diskon", [0, 10, 12.5])
+def test_semua_cara_hitung_total_sama(diskon):
+    random.seed(1)
+    items = pos.buat_data_belanja(60)
+    harapan = pos.hitung_total_on(items, diskon)
+    kolom = pos.KeranjangKolom.dari_items(items)
+    berjalan = pos.KeranjangBerjalan.dari_items(items)
+
+    assert pos.hitung_total_on2(items, diskon) == pytest.approx(harapan)
+    for keranjang in (items, kolom, berjalan):
+        assert pos.hitung_total_o1(keranjang, diskon) == pytest.approx(harapan)
+    assert pos.hitung_total_on2(berjalan, diskon) == pytest.approx(harapan)
+    assert kolom.subtotal_per_kategori() == subtotal_per_kategori(items)
+
+
+def test_keranjang_kolom_langsung_sama_dengan_list_item():
+    random.seed(2)
+    kolom = pos.buat_data_belanja(100, kolom=True)
+    items = list(kolom)
+
+    assert len(kolom) == 100
+    assert kolom.total(10) == pytest.approx(pos.hitung_total_on(items, 10))
+    assert kolom.subtotal_per_kategori() == subtotal_per_kategori(items)
+    assert kolom[3].nama == items[3].nama
+
+
+def test_keranjang_berjalan_mengikuti_perubahan():
+    random.seed(3)
+    items = pos.buat_data_belanja(20)
+    keranjang = pos.KeranjangBerjalan()
+    baris = [keranjang.tambah(item) for item in items]
+    keranjang.ubah_jumlah(baris[0], 3)
+    keranjang.hapus(baris[5])
+    keranjang.ubah_jumlah(baris[7], 0)
+
+    unit = [items[0]] * 3 + [item for i, item in enumerate(items) if i not in (0, 5, 7)]
+    assert len(keranjang) == len(unit)
+    assert [keranjang[i] for i in range(len(keranjang))] == unit
+    assert keranjang[-1] is unit[-1] and keranjang[1:4] == unit[1:4]
+    assert keranjang.total(10) == pytest.approx(pos.hitung_total_on(unit, 10))
+    assert keranjang.subtotal_kategori == subtotal_per_kategori(unit)
+
+    with pytest.raises(ValueError):
+        keranjang.tambah(items[0], 0)
+
+
+def test_taksir_eksponen_dari_data_kuadratik():
+    ukuran = [10, 20, 40, 80]
+    assert pos.taksir_eksponen(ukuran, [3 * n ** 2 for n in ukuran]) == pytest.approx(2)
+    ringkasan = pos.ringkas_sampel([5.0, 1.0, 3.0])
+    assert ringkasan["median_ns"] == 3.0 and ringkasan["p95_ns"] == 5.0
+
+
+def test_struk_massal_sama_dengan_cetak_struk_dan_menerima_diskon_numpy():
+    random.seed(4)
+    daftar = [pos.buat_data_belanja(3) for _ in range(6)] + [pos.buat_data_belanja(4, kolom=True)]
+    harapan = io.StringIO()
+    for keranjang in daftar:
+        pos.cetak_struk(keranjang, 10.0, file=harapan)
+
+    for workers in (None, 2):
+        hasil = io.StringIO()
+        assert pos.tulis_struk_massal(daftar, hasil, np.float64(10), workers=workers, ukuran_batch=2) == len(daftar)
+        assert hasil.getvalue() == harapan.getvalue()
+
+    with pytest.raises(ValueError):
+        pos.tulis_struk_massal(daftar, io.StringIO(), [10, 20])
+
+
+def test_daftar_impor_eager_dibaca_dari_script_yang_diukur():
+    folder = Path(__file__).parent
+    assert pos.baca_impor_eager(folder / "ALPRO2 QUIZ week6.py") == pos.IMPOR_EAGER
+    assert "asyncio" in pos.baca_impor_eager(folder / "TugasWeek 6 " / "media.py")
+    with pytest.raises(ValueError):
+        pos.baca_impor_eager(folder / "week7-Daniel.py")
@@ -0,0 +1,105 @@
+import importlib.util
+import random
+import sys
+from importlib.machinery import SourceFileLoader
+from pathlib import Path
+
+import pytest
+
+# File tanpa ekstensi .py, jadi dimuat dengan SourceFileLoader; didaftarkan di sys.modules
+# agar fungsi pekerja optimasi_paralel bisa di-pickle
+_path = str(Path(__file__).with_name("UTS Kel. 11 Daniel & Benaya"))
+_spec = importlib.util.spec_from_loader("uts", SourceFileLoader("uts", _path))
+uts = importlib.util.module_from_spec(_spec)
+sys.modules["uts"] = uts
+_spec.loader.exec_module(uts)
+
+
+@pytest.fixture(autouse=True)
+def tanpa_animasi(monkeypatch):
+    # Mesin optimasi tidak boleh memanggil animasi loading (hanya antarmuka yang boleh)
+    def gagal(*args, **kwargs):
+        raise AssertionError("print_loading dipanggil di luar antarmuka")
+    monkeypatch.setattr(uts, "print_loading", gagal)
+
+
+def buat_sistem(seed, jumlah_pekerja, jumlah_area, nama_kembar=False):
+    rnd = random.Random(seed)
+    sistem = uts.CleaningServices()
+    nama = [f"A{rnd.randint(0, jumlah_area // 2)}" if nama_kembar else f"A{j}" for j in range(jumlah_area)]
+    for i in range(jumlah_pekerja):
+        sistem.tambah_pekerja(f"P{i}", rnd.randint(1, 10), rnd.sample(nama, min(3, jumlah_area)),
+                              rnd.choice([4, 6, 7.5, 8]))
+    for j in range(jumlah_area):
+        sistem.tambah_area(nama[j], rnd.randint(1, 10), round(rnd.uniform(0.1, 4), 1), rnd.randint(1, 5))
+    return sistem
+
+
+def periksa_konsisten(sistem):
+    """Setiap area dibagi tepat sekali dan waktu_total sama dengan jumlah waktu tugasnya"""
+    area = sorted(t['area'] for tugas in sistem.hasil_pembagian.values() for t in tugas)
+    assert area == sorted(a['nama'] for a in sistem.area)
+    for nama, tugas in sistem.hasil_pembagian.items():
+        assert sum(t['waktu'] for t in tugas) == pytest.approx(sistem.waktu_total[nama])
+
+
+def test_matriks_waktu_sama_dengan_hitung_waktu_pembersihan():
+    sistem = buat_sistem(1, 6, 25, nama_kembar=True)
+    matriks = sistem.matriks_waktu()
+    for j, area in enumerate(sistem.area):
+        for i, pekerja in enumerate(sistem.pekerja):
+            assert matriks[j, i] == sistem.hitung_waktu_pembersihan(pekerja, area)
+
+
+@pytest.mark.parametrize("metode", ["greedy", "flow"])
+def test_bagi_tugas_membagi_semua_area(metode):
+    for seed in range(10):
+        sistem = buat_sistem(seed, 2 + seed % 5, 5 + 3 * seed, nama_kembar=seed % 2 == 1)
+        sistem.bagi_tugas(metode)
+        periksa_konsisten(sistem)
+
+
+def test_optimasi_pembagian_tidak_memperburuk_skor():
+    for seed in range(10):
+        sistem = buat_sistem(seed, 2 + seed % 5, 5 + 3 * seed, nama_kembar=seed % 2 == 1)
+        sistem.bagi_tugas()
+        skor_awal = sistem.evaluasi_solusi()
+        random.seed(seed)
+        sistem.optimasi_pembagian(2000)
+        periksa_konsisten(sistem)
+        assert sistem.evaluasi_solusi() >= skor_awal - 1e-9
+
+
+@pytest.mark.parametrize("metode", ["annealing", "tabu"])
+def test_metaheuristik_dapat_diulang_dan_skornya_konsisten(metode):
+    hasil = []
+    for _ in range(2):
+        sistem = buat_sistem(3, 5, 40)
+        sistem.bagi_tugas()
+        skor_awal = sistem.evaluasi_solusi()
+        info = sistem.optimasi_metaheuristik(metode, iterasi=3000, seed=7)
+        periksa_konsisten(sistem)
+        assert info['skor_akhir'] >= skor_awal - 1e-9
+        assert info['trace'][-1][2] == pytest.approx(info['skor_akhir'])
+        hasil.append(sistem.hasil_pembagian)
+    assert hasil[0] == hasil[1]
+
+
+@pytest.mark.parametrize("opsi", [{'suhu_akhir': 0}, {'suhu_awal': 0}, {'peluang_awal': 1}])
+def test_suhu_annealing_tidak_valid_ditolak(opsi):
+    sistem = buat_sistem(4, 3, 10)
+    sistem.bagi_tugas()
+    with pytest.raises(ValueError):
+        sistem.optimasi_metaheuristik(iterasi=100, seed=1, **opsi)
+
+
+def test_paralel_sama_dengan_berurutan():
+    hasil = []
+    for workers in (1, 2):
+        sistem = buat_sistem(5, 6, 60, nama_kembar=True)
+        sistem.bagi_tugas()
+        info = sistem.optimasi_paralel(batas_waktu=None, iterasi=3000, workers=workers, jumlah_start=3, seed=9)
+        periksa_konsisten(sistem)
+        assert info['skor_akhir'] == pytest.approx(max(info['skor_per_start']))
+        hasil.append((sistem.hasil_pembagian, info['skor_per_start']))
+    assert hasil[0] == hasil[1]
@@ -0,0 +1,116 @@
+import importlib.util
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Nama file berisi tanda hubung, jadi dimuat lewat path; didaftarkan di sys.modules agar
+# fungsi pekerja rencana_paralel bisa di-pickle
+_spec = importlib.util.spec_from_file_location("week7", Path(__file__).with_name("week7-Daniel.py"))
+week7 = importlib.util.module_from_spec(_spec)
+sys.modules["week7"] = week7
+_spec.loader.exec_module(week7)
+
+BUDGET = [0, 1_000_000, 25_000_000, 30_000_000, 41_000_000, 50_000_000, 60_000_000]
+
+
+def katalog_acak(seed):
+    """Data acak dengan bentuk yang sama seperti data bawaan (harga kelipatan Rp 50.000)"""
+    rnd = random.Random(seed)
+
+    def opsi(awalan, jumlah, maks):
+        return [{"nama": f"{awalan} {i}", "harga": rnd.randrange(0, maks) * 50_000} for i in range(jumlah)]
+
+    return {
+        "PESAWAT": [rnd.randrange(100, 400) * 50_000 for _ in range(rnd.randint(1, 2))],
+        "KOMUNIKASI": [rnd.randrange(1, 20) * 50_000 for _ in range(3)],
+        "HOTEL": [rnd.randrange(60, 300) * 50_000 for _ in range(3)],
+        "TEMPAT_MAKAN": opsi("makan", 6, 10),
+        "TRANSPORTASI": opsi("transportasi", 2, 12),
+        "TEMPAT_WISATA": opsi("wisata", 4, 20),
+        "TEMPAT_BELANJA": opsi("belanja", 4, 25),
+        "BATAS_MAKAN": rnd.randrange(10, 50) * 50_000,
+        "BATAS_WISATA": rnd.randrange(10, 50) * 50_000,
+        "BATAS_BELANJA": rnd.randrange(10, 70) * 50_000,
+    }
+
+
+@pytest.fixture(params=[None, 1, 2, 3], ids=["bawaan", "acak1", "acak2", "acak3"])
+def data(request, monkeypatch):
+    """Data bawaan, atau data acak yang dipasang ke modul agar backtracking dasar ikut memakainya"""
+    if request.param is not None:
+        nilai = katalog_acak(request.param)
+        for nama, isi in nilai.items():
+            monkeypatch.setattr(week7, nama, isi)
+        monkeypatch.setattr(week7, "KATEGORI", [
+            ("pesawat", nilai["PESAWAT"], None),
+            ("komunikasi", nilai["KOMUNIKASI"], None),
+            ("hotel", nilai["HOTEL"], None),
+            ("makan", nilai["TEMPAT_MAKAN"], nilai["BATAS_MAKAN"]),
+            ("transportasi", nilai["TRANSPORTASI"], None),
+            ("wisata", nilai["TEMPAT_WISATA"], nilai["BATAS_WISATA"]),
+            ("belanja", nilai["TEMPAT_BELANJA"], nilai["BATAS_BELANJA"]),
+        ])
+    return request.param
+
+
+def dasar(budget):
+    return week7.rencana_liburan_korea(budget, "backtracking", tampilkan=False)
+
+
+@pytest.mark.parametrize("metode", ["branch_and_bound", "tanpa_salin"])
+def test_metode_sama_dengan_backtracking_dasar(data, metode):
+    for budget in BUDGET:
+        assert week7.rencana_liburan_korea(budget, metode, tampilkan=False) == dasar(budget)
+
+
+def test_dp_dan_batch_memberi_total_yang_sama(data):
+    # DP bisa memilih kombinasi lain dengan total yang sama, jadi yang dibandingkan totalnya
+    batch = week7.rencana_batch(BUDGET)
+    for i, budget in enumerate(BUDGET):
+        rencana = week7.rencana_liburan_korea(budget, "dp", tampilkan=False)
+        assert rencana["total_biaya"] == dasar(budget)["total_biaya"]
+        assert rencana["total_biaya"] + rencana["sisa_budget"] == budget
+        assert batch["total_biaya"][i] == rencana["total_biaya"]
+
+
+def test_cache_anytime_dan_top_k_sama_dengan_backtracking_dasar(data):
+    cache = week7.CacheSubsetSum()
+    for budget in BUDGET:
+        harapan = dasar(budget)
+        assert week7.rencana_liburan_korea(budget, "tanpa_salin", tampilkan=False, cache=cache) == harapan
+        assert week7.rencana_anytime(budget) == (harapan, True)
+        if harapan["total_biaya"] > 0:
+            assert week7.rencana_top_k(budget, k=3)["top_k"][0] == harapan
+
+
+@pytest.mark.parametrize("kedalaman", [0, 1, 2, 3, None])
+def test_paralel_sama_dengan_backtracking_dasar(data, kedalaman):
+    for budget in (25_000_000, 50_000_000):
+        rencana = week7.rencana_liburan_korea(budget, workers=2, kedalaman_split=kedalaman, tampilkan=False)
+        assert rencana == dasar(budget)
+
+
+def test_opsi_yang_tidak_didukung_ditolak():
+    with pytest.raises(ValueError):
+        week7.rencana_liburan_korea(1_000_000, "tidak_ada", workers=2, tampilkan=False)
+    with pytest.raises(ValueError):
+        week7.rencana_liburan_korea(1_000_000, cache=week7.CacheSubsetSum(), tampilkan=False)
+    with pytest.raises(ValueError):
+        week7.rencana_liburan_korea(1_000_000, "dp", instrumen=week7.StatistikPencarian(), tampilkan=False)
+
+
+def test_banyak_opsi_tidak_kena_batas_rekursi():
+    # 10^4 opsi per kategori pilih-banyak; hanya sedikit yang muat di batas kategorinya
+    katalog = week7.Katalog()
+    hotel = katalog.tambah_kategori("hotel")
+    for i, harga in enumerate((7_000_000, 10_000_000)):
+        katalog.tambah_opsi(hotel, f"hotel {i}", harga)
+    makan = katalog.tambah_kategori("makan", batas=2_000_000)
+    belanja = katalog.tambah_kategori("belanja", batas=1_500_000)
+    for i in range(10_000):
+        katalog.tambah_opsi(makan, f"makan {i}", 300_000 if i % 2_500 == 0 else 2_500_000 + i)
+        katalog.tambah_opsi(belanja, f"belanja {i}", 500_000 if i % 3_333 == 0 else 1_600_000 + i)
+    rencana = week7.rencana_liburan_korea(12_000_000, "tanpa_salin", katalog=katalog, tampilkan=False)
+    assert rencana["total_biaya"] == 10_000_000 + 3 * 300_000 + 2 * 500_000
@@ -1,36 +1,258 @@
-def rencana_liburan_korea(budget_total=50000000):
-    # Definisi kategori pengeluaran dan opsi-opsinya
-    pesawat = [19000000]  # harga pesawat per orang
-    komunikasi = [250000, 500000, 800000]  # pilihan paket komunikasi
-    hotel = [7000000, 10000000, 14000000]  # pilihan harga hotel di Hotel Shilla Stay
-    
-    # Opsi tempat makan
-    tempat_makan = [
-        {"nama": "Tosokchon Samgyetan", "harga": 300000},
-        {"nama": "Samyukga", "harga": 400000},
-        {"nama": "Osege Hyang", "harga": 350000},
-        {"nama": "Mouse Rabbit Coffee", "harga": 150000},
-        {"nama": "Cloudy Sky", "harga": 200000}
-    ]
-    
-    # Opsi transportasi
-    transportasi = [{"nama": "Taxi", "harga": 500000}]
-    
-    # Opsi tempat wisata
-    tempat_wisata = [
-        {"nama": "Lotte World", "harga": 800000},
-        {"nama": "Myeongdong Street", "harga": 0},
-        {"nama": "Pulau Nami", "harga": 600000},
-        {"nama": "N Seoul Tower", "harga": 700000}
-    ]
-    
-    # Opsi tempat belanja
-    tempat_belanja = [
-        {"nama": "Myeongdong Street", "harga": 1000000},
-        {"nama": "Olive Young", "harga": 500000},
-        {"nama": "Gotto Mall", "harga": 800000},
-        {"nama": "Music Korea", "harga": 700000}
-    ]
+import csv
+import hashlib
+import heapq
+import json
+import math
+import os
+import sys
+import time
+import tracemalloc
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Value
+
+import numpy as np
+
+# Definisi kategori pengeluaran dan opsi-opsinya
+PESAWAT = [19000000]  # harga pesawat per orang
+KOMUNIKASI = [250000, 500000, 800000]  # pilihan paket komunikasi
+HOTEL = [7000000, 10000000, 14000000]  # pilihan harga hotel di Hotel Shilla Stay
+
+# Opsi tempat makan
+TEMPAT_MAKAN = [
+    {"nama": "Tosokchon Samgyetan", "harga": 300000},
+    {"nama": "Samyukga", "harga": 400000},
+    {"nama": "Osege Hyang", "harga": 350000},
+    {"nama": "Mouse Rabbit Coffee", "harga": 150000},
+    {"nama": "Cloudy Sky", "harga": 200000}
+]
+
+# Opsi transportasi
+TRANSPORTASI = [{"nama": "Taxi", "harga": 500000}]
+
+# Opsi tempat wisata
+TEMPAT_WISATA = [
+    {"nama": "Lotte World", "harga": 800000},
+    {"nama": "Myeongdong Street", "harga": 0},
+    {"nama": "Pulau Nami", "harga": 600000},
+    {"nama": "N Seoul Tower", "harga": 700000}
+]
+
+# Opsi tempat belanja
+TEMPAT_BELANJA = [
+    {"nama": "Myeongdong Street", "harga": 1000000},
+    {"nama": "Olive Young", "harga": 500000},
+    {"nama": "Gotto Mall", "harga": 800000},
+    {"nama": "Music Korea", "harga": 700000}
+]
+
+# Batas anggaran untuk kategori yang boleh memilih beberapa tempat
+BATAS_MAKAN = 2000000
+BATAS_WISATA = 2100000
+BATAS_BELANJA = 3000000
+
+# Urutan kategori sama dengan urutan pencarian backtracking.
+# Format: (kunci, daftar opsi, batas anggaran). Batas None berarti hanya boleh pilih satu opsi.
+KATEGORI = [
+    ("pesawat", PESAWAT, None),
+    ("komunikasi", KOMUNIKASI, None),
+    ("hotel", HOTEL, None),
+    ("makan", TEMPAT_MAKAN, BATAS_MAKAN),
+    ("transportasi", TRANSPORTASI, None),
+    ("wisata", TEMPAT_WISATA, BATAS_WISATA),
+    ("belanja", TEMPAT_BELANJA, BATAS_BELANJA)
+]
+
+class Katalog:
+    """
+    Katalog opsi berbasis array untuk mesin pencarian.
+    Setiap kategori menyimpan array('q') harga dan array('q') index nama (ke tabel self.nama),
+    sehingga pencarian cukup memakai index int. Nama baru dipakai saat membuat rencana untuk output.
+    """
+    def __init__(self):
+        self.kunci = []  # nama kategori sesuai urutan pencarian
+        self.batas = []  # batas anggaran kategori, None = hanya boleh pilih satu opsi
+        self.angka = []  # True jika opsi ditulis di rencana sebagai angka (seperti pesawat, hotel)
+        self.harga = []  # array('q') harga per kategori
+        self.id_nama = []  # array('q') index nama per kategori
+        self.nama = []
+        self._index_nama = {}
+    
+    def __len__(self):
+        return len(self.kunci)
+    
+    def tambah_kategori(self, kunci, batas=None, angka=False):
+        """Menambahkan kategori baru dan mengembalikan index-nya"""
+        if kunci in self.kunci:
+            raise ValueError(f"Kategori {kunci} sudah ada")
+        self.kunci.append(kunci)
+        self.batas.append(batas)
+        self.angka.append(angka)
+        self.harga.append(array("q"))
+        self.id_nama.append(array("q"))
+        return len(self.kunci) - 1
+    
+    def tambah_opsi(self, k, nama, harga):
+        """Menambahkan opsi ke kategori ke-k"""
+        if harga < 0:
+            raise ValueError(f"Harga {nama} tidak boleh negatif")
+        if nama not in self._index_nama:
+            self._index_nama[nama] = len(self.nama)
+            self.nama.append(nama)
+        self.harga[k].append(harga)
+        self.id_nama[k].append(self._index_nama[nama])
+    
+    def harga_list(self):
+        """
+        Salinan harga per kategori sebagai list int untuk loop pencarian.
+        Mengindeks array('q') membuat objek int baru setiap kali, sedangkan list tidak.
+        """
+        return [h.tolist() for h in self.harga]
+    
+    def sidik_jari(self, k):
+        """Hash harga kategori ke-k, agar cache tidak tertukar antar katalog yang berbeda"""
+        return hashlib.sha1(self.harga[k].tobytes()).hexdigest()
+    
+    def opsi(self, k, i):
+        """Opsi ke-i dari kategori ke-k dalam bentuk yang dipakai di rencana_terbaik"""
+        if self.angka[k]:
+            return self.harga[k][i]
+        return {"nama": self.nama[self.id_nama[k][i]], "harga": self.harga[k][i]}
+    
+    @classmethod
+    def dari_kategori(cls, kategori=None):
+        """Membuat katalog dari daftar (kunci, opsi, batas) seperti KATEGORI"""
+        katalog = cls()
+        for kunci, opsi, batas in (KATEGORI if kategori is None else kategori):
+            angka = bool(opsi) and isinstance(opsi[0], int)
+            k = katalog.tambah_kategori(kunci, batas, angka)
+            for o in opsi:
+                if angka:
+                    katalog.tambah_opsi(k, f"{kunci} {o}", o)
+                else:
+                    katalog.tambah_opsi(k, o["nama"], o["harga"])
+        return katalog
+
+def muat_katalog(path):
+    """
+    Memuat katalog dari file CSV atau JSON (dilihat dari ekstensi file).
+    - CSV: kolom kategori, nama, harga, dan batas (opsional). Batas cukup diisi di salah satu
+      baris kategori; kategori tanpa batas hanya boleh pilih satu opsi.
+    - JSON: {"kategori": [{"kunci": ..., "batas": ..., "opsi": [{"nama": ..., "harga": ...}]}]}
+      Opsi boleh berupa angka saja; kategori seperti itu ditulis sebagai angka di rencana.
+    Urutan kategori mengikuti urutan kemunculan di file.
+    """
+    katalog = Katalog()
+    if path.lower().endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        for kategori in data["kategori"]:
+            opsi = kategori.get("opsi", [])
+            angka = bool(opsi) and isinstance(opsi[0], int)
+            k = katalog.tambah_kategori(kategori["kunci"], kategori.get("batas"), angka)
+            for o in opsi:
+                if angka:
+                    katalog.tambah_opsi(k, f"{kategori['kunci']} {o}", int(o))
+                else:
+                    katalog.tambah_opsi(k, o["nama"], int(o["harga"]))
+        return katalog
+    
+    if not path.lower().endswith(".csv"):
+        raise ValueError(f"Format katalog tidak dikenal: {path}")
+    index_kategori = {}
+    with open(path, newline="", encoding="utf-8") as f:
+        for baris in csv.DictReader(f):
+            kunci = baris["kategori"].strip()
+            if kunci not in index_kategori:
+                index_kategori[kunci] = katalog.tambah_kategori(kunci)
+            k = index_kategori[kunci]
+            if (baris.get("batas") or "").strip():
+                katalog.batas[k] = int(baris["batas"])
+            katalog.tambah_opsi(k, baris["nama"].strip(), int(baris["harga"]))
+    return katalog
+
+def rencana_liburan_korea(budget_total=50000000, metode="backtracking", satuan_harga=1000, statistik=None,
+                          tampilkan=True, workers=None, kedalaman_split=None, katalog=None, cache=None,
+                          instrumen=None):
+    """
+    Mencari rencana liburan yang memaksimalkan penggunaan budget.
+    metode: "backtracking" (pencarian lengkap), "branch_and_bound" (backtracking dengan
+            pemangkasan batas atas), "tanpa_salin" (backtracking tanpa menyalin rencana)
+            atau "dp" (dynamic programming / knapsack)
+    satuan_harga: satuan harga untuk tabel DP, misalnya Rp 1.000
+    statistik: dict opsional yang diisi jumlah node dikunjungi dan dipangkas (mode backtracking)
+    tampilkan: False untuk tidak mencetak rencana (misalnya saat benchmark)
+    workers: jumlah proses untuk pencarian paralel (hanya untuk metode backtracking)
+    kedalaman_split: jumlah kategori pilih-satu di awal yang dipecah menjadi subpohon paralel
+                     (None: sebanyak mungkin, maksimal 3)
+    katalog: Katalog dari muat_katalog; None berarti katalog bawaan (KATEGORI)
+    cache: CacheSubsetSum untuk metode tanpa_salin (tidak bisa digabung dengan workers)
+    instrumen: StatistikPencarian untuk metode tanpa_salin (node, daun, perbaikan, waktu per kategori;
+               tidak bisa digabung dengan workers)
+    """
+    if metode not in ("backtracking", "branch_and_bound", "tanpa_salin", "dp"):
+        raise ValueError(f"Metode tidak dikenal: {metode}")
+    if workers is not None and metode == "dp":
+        raise ValueError("Opsi workers hanya untuk metode backtracking")
+    if workers is not None and (cache is not None or instrumen is not None):
+        raise ValueError("Opsi cache dan instrumen tidak didukung bersama workers; gunakan metode tanpa_salin")
+    if cache is not None and metode != "tanpa_salin":
+        raise ValueError("Opsi cache hanya untuk metode tanpa_salin")
+    if instrumen is not None and metode != "tanpa_salin":
+        raise ValueError("Opsi instrumen hanya untuk metode tanpa_salin")
+    if metode in ("dp", "tanpa_salin") or workers is not None:
+        if metode == "dp":
+            rencana_terbaik = rencana_dp(budget_total, satuan_harga, katalog)
+        elif workers is not None:
+            rencana_terbaik = rencana_paralel(budget_total, workers, kedalaman_split, statistik, katalog)
+        else:
+            rencana_terbaik = rencana_tanpa_salin(budget_total, statistik, katalog, cache, instrumen)
+        if tampilkan:
+            tampilkan_rencana(rencana_terbaik, budget_total, katalog)
+        return rencana_terbaik
+    if katalog is not None:
+        raise ValueError(f"Metode {metode} hanya untuk katalog bawaan; gunakan tanpa_salin atau dp")
+    pangkas = metode == "branch_and_bound"
+    
+    pesawat = PESAWAT
+    komunikasi = KOMUNIKASI
+    hotel = HOTEL
+    tempat_makan = TEMPAT_MAKAN
+    transportasi = TRANSPORTASI
+    tempat_wisata = TEMPAT_WISATA
+    tempat_belanja = TEMPAT_BELANJA
+    
+    # Batas atas optimis per kategori dan sisa harga opsi untuk kategori pilih-banyak
+    batas_setelah, sisa_harga = _batas_pencarian([[_harga(o) for o in opsi] for _, opsi, _ in KATEGORI],
+                                                 [batas for _, _, batas in KATEGORI])
+    sisa_makan, sisa_wisata, sisa_belanja = sisa_harga[3], sisa_harga[5], sisa_harga[6]
+    
+    node_dikunjungi = 0
+    node_dipangkas = 0
+    selesai = False  # True jika sudah ditemukan rencana yang pas dengan budget
+    
+    def dipangkas(rencana, tambahan_maks):
+        """Menghitung node dan memeriksa apakah cabang ini tidak mungkin mengalahkan rencana terbaik"""
+        nonlocal node_dikunjungi, node_dipangkas
+        if selesai:
+            return True
+        node_dikunjungi += 1
+        if pangkas and rencana["total_biaya"] + min(rencana["sisa_budget"], tambahan_maks) <= rencana_terbaik["total_biaya"]:
+            node_dipangkas += 1
+            return True
+        return False
+    
+    def catat_terbaik(rencana):
+        """Menyimpan rencana sebagai rencana terbaik"""
+        nonlocal selesai
+        rencana_terbaik.update(rencana)
+        rencana_terbaik["makan"] = rencana["makan"].copy()
+        rencana_terbaik["transportasi"] = rencana["transportasi"].copy()
+        rencana_terbaik["wisata"] = rencana["wisata"].copy()
+        rencana_terbaik["belanja"] = rencana["belanja"].copy()
+        if pangkas and rencana["sisa_budget"] == 0:
+            selesai = True
     
     # Inisialisasi hasil terbaik
     rencana_terbaik = {
@@ -47,17 +269,14 @@ def rencana_liburan_korea(budget_total=50000000):
     
     # Fungsi backtracking untuk menghasilkan rencana liburan
     def backtrack(rencana_saat_ini, kategori_saat_ini=0):
-        nonlocal rencana_terbaik
-        
         # Kategori: 0=pesawat, 1=komunikasi, 2=hotel, 3=makan, 4=transportasi, 5=wisata, 6=belanja
         if kategori_saat_ini > 6:
             # Rencana lengkap, periksa apakah ini lebih baik
             if rencana_saat_ini["total_biaya"] > rencana_terbaik["total_biaya"] and rencana_saat_ini["sisa_budget"] >= 0:
-                rencana_terbaik = rencana_saat_ini.copy()
-                rencana_terbaik["makan"] = rencana_saat_ini["makan"].copy()
-                rencana_terbaik["transportasi"] = rencana_saat_ini["transportasi"].copy()
-                rencana_terbaik["wisata"] = rencana_saat_ini["wisata"].copy()
-                rencana_terbaik["belanja"] = rencana_saat_ini["belanja"].copy()
+                catat_terbaik(rencana_saat_ini)
+            return
+        
+        if dipangkas(rencana_saat_ini, batas_setelah[kategori_saat_ini]):
             return
         
         # Kategori Pesawat
@@ -93,7 +312,7 @@ def rencana_liburan_korea(budget_total=50000000):
         # Kategori Makan (bisa pilih beberapa tempat makan)
         elif kategori_saat_ini == 3:
             # Coba semua kombinasi tempat makan dalam batas anggaran 2 juta
-            makan_backtrack(rencana_saat_ini, 0, 0, 2000000)
+            makan_backtrack(rencana_saat_ini, 0, 0, BATAS_MAKAN)
         
         # Kategori Transportasi
         elif kategori_saat_ini == 4:
@@ -109,12 +328,12 @@ def rencana_liburan_korea(budget_total=50000000):
         # Kategori Wisata (bisa pilih beberapa tempat wisata)
         elif kategori_saat_ini == 5:
             # Coba semua kombinasi tempat wisata dalam batas anggaran 2.1 juta
-            wisata_backtrack(rencana_saat_ini, 0, 0, 2100000)
+            wisata_backtrack(rencana_saat_ini, 0, 0, BATAS_WISATA)
         
         # Kategori Belanja (bisa pilih beberapa tempat belanja)
         elif kategori_saat_ini == 6:
             # Coba semua kombinasi tempat belanja dalam batas anggaran 3 juta
-            belanja_backtrack(rencana_saat_ini, 0, 0, 3000000)
+            belanja_backtrack(rencana_saat_ini, 0, 0, BATAS_BELANJA)
     
     # Fungsi backtracking untuk tempat makan
     def makan_backtrack(rencana, index, total_makan, batas_makan):
@@ -125,6 +344,9 @@ def rencana_liburan_korea(budget_total=50000000):
                 backtrack(rencana, 4)  # Lanjut ke transportasi
             return
         
+        if dipangkas(rencana, min(batas_makan - total_makan, sisa_makan[index]) + batas_setelah[4]):
+            return
+        
         # Pilihan 1: Pilih tempat makan saat ini
         tempat = tempat_makan[index]
         if tempat["harga"] + total_makan <= batas_makan and tempat["harga"] <= rencana["sisa_budget"]:
@@ -147,6 +369,9 @@ def rencana_liburan_korea(budget_total=50000000):
                 backtrack(rencana, 6)  # Lanjut ke belanja
             return
         
+        if dipangkas(rencana, min(batas_wisata - total_wisata, sisa_wisata[index]) + batas_setelah[6]):
+            return
+        
         # Pilihan 1: Pilih tempat wisata saat ini
         tempat = tempat_wisata[index]
         if tempat["harga"] + total_wisata <= batas_wisata and tempat["harga"] <= rencana["sisa_budget"]:
@@ -168,11 +393,10 @@ def rencana_liburan_korea(budget_total=50000000):
             if rencana["belanja"] and total_belanja <= batas_belanja:
                 # Cek rencana final
                 if rencana["total_biaya"] > rencana_terbaik["total_biaya"] and rencana["sisa_budget"] >= 0:
-                    rencana_terbaik.update(rencana)
-                    rencana_terbaik["makan"] = rencana["makan"].copy()
-                    rencana_terbaik["transportasi"] = rencana["transportasi"].copy()
-                    rencana_terbaik["wisata"] = rencana["wisata"].copy()
-                    rencana_terbaik["belanja"] = rencana["belanja"].copy()
+                    catat_terbaik(rencana)
+            return
+        
+        if dipangkas(rencana, min(batas_belanja - total_belanja, sisa_belanja[index])):
             return
         
         # Pilihan 1: Pilih tempat belanja saat ini
@@ -203,7 +427,23 @@ def rencana_liburan_korea(budget_total=50000000):
     
     backtrack(rencana_awal)
     
+    if statistik is not None:
+        statistik["node_dikunjungi"] = node_dikunjungi
+        statistik["node_dipangkas"] = node_dipangkas
+    
     # Tampilkan hasil rencana terbaik
+    if tampilkan:
+        tampilkan_rencana(rencana_terbaik, budget_total)
+        if pangkas:
+            print(f"Node Dikunjungi: {node_dikunjungi:,} (dipangkas: {node_dipangkas:,})")
+    
+    return rencana_terbaik
+
+def tampilkan_rencana(rencana_terbaik, budget_total, katalog=None):
+    """Menampilkan perincian rencana liburan"""
+    if katalog is not None:
+        _tampilkan_rencana_katalog(rencana_terbaik, budget_total, katalog)
+        return
     print("=== RENCANA LIBURAN KOREA SELATAN ===")
     print(f"Budget Total: Rp {budget_total:,}")
     print("\nPerincian Biaya:")
@@ -242,11 +482,1060 @@ def rencana_liburan_korea(budget_total=50000000):
     print("\n=== RINGKASAN ===")
     print(f"Total Biaya: Rp {rencana_terbaik['total_biaya']:,}")
     print(f"Sisa Budget: Rp {rencana_terbaik['sisa_budget']:,}")
+
+def _tampilkan_rencana_katalog(rencana_terbaik, budget_total, katalog):
+    """Menampilkan perincian rencana untuk katalog dari file (kategori bebas)"""
+    print("=== RENCANA LIBURAN ===")
+    print(f"Budget Total: Rp {budget_total:,}")
+    print("\nPerincian Biaya:")
+    for nomor, kunci in enumerate(katalog.kunci, 1):
+        nilai = rencana_terbaik[kunci]
+        if isinstance(nilai, int):
+            print(f"{nomor}. {kunci.capitalize()}: Rp {nilai:,}")
+            continue
+        print(f"\n{nomor}. {kunci.capitalize()}:")
+        for tempat in nilai:
+            print(f"   - {tempat['nama']}: Rp {tempat['harga']:,}")
+        print(f"   Total {kunci.capitalize()}: Rp {sum(t['harga'] for t in nilai):,}")
+    
+    print("\n=== RINGKASAN ===")
+    print(f"Total Biaya: Rp {rencana_terbaik['total_biaya']:,}")
+    print(f"Sisa Budget: Rp {rencana_terbaik['sisa_budget']:,}")
+
+
+def _harga(opsi):
+    """Mengambil harga dari opsi (angka biasa atau dict dengan kunci "harga")"""
+    return opsi if isinstance(opsi, int) else opsi["harga"]
+
+def _katalog(katalog):
+    """Katalog yang dipakai mesin pencarian; None berarti katalog bawaan dari KATEGORI"""
+    return Katalog.dari_kategori() if katalog is None else katalog
+
+def _pengeluaran_maks(harga, batas):
+    """Pengeluaran terbesar yang mungkin untuk satu kategori (dipakai sebagai batas atas)"""
+    if not harga:
+        return 0
+    if batas is None:
+        return max(harga)
+    if sum(harga) <= batas:
+        return sum(harga)
+    # Subset sum dengan bitset; harga dibagi FPB agar bitset tetap kecil
+    fpb = 0
+    for h in harga:
+        fpb = math.gcd(fpb, h)
+    batas_satuan = batas // fpb
+    mask = (1 << (batas_satuan + 1)) - 1
+    bisa = 1
+    for h in harga:
+        bisa |= (bisa << (h // fpb)) & mask
+    return (bisa.bit_length() - 1) * fpb
+
+def _batas_pencarian(harga, batas):
+    """
+    Data pemangkasan yang dipakai semua mesin branch and bound:
+    - batas_setelah[k]: pengeluaran terbesar yang masih bisa ditambahkan oleh kategori ke-k
+      sampai terakhir (kategori pilih-banyak dibatasi batasnya)
+    - sisa_harga[k][i]: jumlah harga opsi ke-i sampai akhir pada kategori ke-k
+    """
+    batas_setelah = [0] * (len(harga) + 1)
+    for k in range(len(harga) - 1, -1, -1):
+        batas_setelah[k] = batas_setelah[k + 1] + _pengeluaran_maks(harga[k], batas[k])
+    sisa_harga = []
+    for h_kategori in harga:
+        sisa = [0] * (len(h_kategori) + 1)
+        for i in range(len(h_kategori) - 1, -1, -1):
+            sisa[i] = sisa[i + 1] + h_kategori[i]
+        sisa_harga.append(sisa)
+    return batas_setelah, sisa_harga
+
+def _rencana_kosong(budget_total, katalog):
+    """Membuat rencana tanpa pengeluaran dengan bentuk yang sama seperti rencana_terbaik"""
+    rencana = {}
+    for k, kunci in enumerate(katalog.kunci):
+        # Kategori dengan opsi berupa angka disimpan sebagai angka, selainnya sebagai daftar
+        rencana[kunci] = 0 if katalog.angka[k] else []
+    rencana["total_biaya"] = 0
+    rencana["sisa_budget"] = budget_total
+    return rencana
+
+def _susun_rencana(katalog, dipilih, budget_total):
+    """Membuat dict rencana dari index opsi yang dipilih per kategori (nama baru dipakai di sini)"""
+    rencana = _rencana_kosong(budget_total, katalog)
+    total = 0
+    for k, kunci in enumerate(katalog.kunci):
+        for i in dipilih[k]:
+            if katalog.angka[k]:
+                rencana[kunci] = katalog.harga[k][i]
+            else:
+                rencana[kunci].append(katalog.opsi(k, i))
+            total += katalog.harga[k][i]
+    rencana["total_biaya"] = total
+    rencana["sisa_budget"] = budget_total - total
+    return rencana
+
+def _daftar_bit(bitset):
+    """Menghasilkan posisi bit yang bernilai 1 (dari kecil ke besar)"""
+    for posisi, bit in enumerate(bin(bitset)[:1:-1]):
+        if bit == "1":
+            yield posisi
+
+def _tabel_dp(katalog, kapasitas, satuan_harga):
+    """
+    Membuat tabel DP (bitset) untuk semua kategori dengan total maksimal kapasitas (dalam satuan_harga).
+    Mengembalikan (kategori dengan harga dalam satuan_harga, tabel per kategori, sisa_bisa).
+    """
+    # Ubah semua harga ke satuan_harga; harus habis dibagi agar hasilnya tetap tepat
+    kategori = []
+    for harga_kategori, batas in zip(katalog.harga, katalog.batas):
+        harga = []
+        for h in harga_kategori:
+            if h % satuan_harga != 0:
+                raise ValueError(f"Harga Rp {h:,} bukan kelipatan satuan harga Rp {satuan_harga:,}")
+            harga.append(h // satuan_harga)
+        batas_satuan = None if batas is None else min(batas // satuan_harga, kapasitas)
+        kategori.append((harga, batas_satuan))
+    
+    # Tabel subset sum untuk kategori pilih-banyak:
+    # semua[i] = total yang bisa dicapai dari opsi ke-i dst (termasuk tidak memilih apa pun)
+    # tidak_kosong[i] = sama seperti semua[i], tetapi minimal satu opsi dipilih
+    tabel = []
+    for harga, batas in kategori:
+        if batas is None:
+            pilihan = 0
+            for h in harga:
+                if h <= kapasitas:
+                    pilihan |= 1 << h
+            tabel.append((pilihan, None, None))
+            continue
+        mask_batas = (1 << (batas + 1)) - 1
+        semua = [0] * len(harga) + [1]
+        tidak_kosong = [0] * (len(harga) + 1)
+        for i in range(len(harga) - 1, -1, -1):
+            geser = (semua[i + 1] << harga[i]) & mask_batas
+            semua[i] = semua[i + 1] | geser
+            tidak_kosong[i] = tidak_kosong[i + 1] | geser
+        tabel.append((tidak_kosong[0], semua, tidak_kosong))
+    
+    # sisa_bisa[k] = total yang bisa dicapai oleh kategori ke-k sampai terakhir
+    mask = (1 << (kapasitas + 1)) - 1
+    sisa_bisa = [0] * len(kategori) + [1]
+    for k in range(len(kategori) - 1, -1, -1):
+        gabungan = 0
+        for total_kategori in _daftar_bit(tabel[k][0]):
+            gabungan |= sisa_bisa[k + 1] << total_kategori
+        sisa_bisa[k] = gabungan & mask
+    return kategori, tabel, sisa_bisa
+
+def rencana_dp(budget_total, satuan_harga=1000, katalog=None):
+    """
+    Mencari rencana terbaik dengan dynamic programming dalam waktu pseudo-polinomial.
+    - Kategori pilih-satu (pesawat, komunikasi, hotel, transportasi) = multiple-choice knapsack
+    - Kategori pilih-banyak (makan, wisata, belanja) = bounded knapsack dengan batas kategori
+    Himpunan total biaya yang mungkin disimpan sebagai bitset (int Python) dalam satuan_harga.
+    Jika ada beberapa rencana optimal, dipilih rencana yang pertama kali ditemukan backtracking.
+    """
+    katalog = _katalog(katalog)
+    if budget_total < 0:
+        return _rencana_kosong(budget_total, katalog)
+    kategori, tabel, sisa_bisa = _tabel_dp(katalog, budget_total // satuan_harga, satuan_harga)
+    
+    # Total terbaik = bit tertinggi; total 0 tidak pernah menggantikan rencana awal
+    target = sisa_bisa[0].bit_length() - 1
+    if target <= 0:
+        return _rencana_kosong(budget_total, katalog)
+    
+    # Rekonstruksi rencana mengikuti urutan pencarian backtracking
+    # (opsi lebih awal dulu, "pilih" sebelum "tidak pilih")
+    dipilih = [[] for _ in kategori]
+    for k, (harga, batas) in enumerate(kategori):
+        pilihan, semua, tidak_kosong = tabel[k]
+        lanjut = sisa_bisa[k + 1]
+        if batas is None:
+            for i, h in enumerate(harga):
+                if h <= target and (lanjut >> (target - h)) & 1:
+                    dipilih[k].append(i)
+                    target -= h
+                    break
+            continue
+        
+        # Total kategori ini yang masih bisa dilengkapi oleh kategori berikutnya
+        tujuan = 0
+        for total_kategori in _daftar_bit(pilihan):
+            if total_kategori > target:
+                break
+            if (lanjut >> (target - total_kategori)) & 1:
+                tujuan |= 1 << total_kategori
+        
+        total_saat_ini = 0
+        for i, h in enumerate(harga):
+            if total_saat_ini + h <= batas and (semua[i + 1] << (total_saat_ini + h)) & tujuan:
+                dipilih[k].append(i)
+                total_saat_ini += h
+        target -= total_saat_ini
+    
+    return _susun_rencana(katalog, dipilih, budget_total)
+
+def rencana_batch(daftar_budget, satuan_harga=1000, katalog=None):
+    """
+    Menjawab banyak budget sekaligus dengan satu tabel DP bersama.
+    Subset sum per kategori dan gabungannya dihitung sekali sampai budget terbesar,
+    lalu setiap budget dijawab dengan lookup vektor NumPy.
+    daftar_budget: list atau array NumPy berisi budget (Rp)
+    Mengembalikan dict berisi array "total_biaya" dan "sisa_budget" dengan urutan yang sama.
+    Rincian rencana untuk satu budget tertentu bisa diambil dengan rencana_dp.
+    """
+    budget = np.asarray(daftar_budget, dtype=np.int64)
+    total_biaya = np.zeros(budget.shape, dtype=np.int64)
+    if budget.size == 0 or budget.max() < 0:
+        return {"total_biaya": total_biaya, "sisa_budget": budget - total_biaya}
+    
+    kapasitas = int(budget.max()) // satuan_harga
+    _, _, sisa_bisa = _tabel_dp(_katalog(katalog), kapasitas, satuan_harga)
+    
+    # Bitset total yang mungkin -> array bool, lalu total terbesar yang <= x untuk setiap x
+    jumlah_byte = kapasitas // 8 + 1
+    bisa = np.unpackbits(np.frombuffer(sisa_bisa[0].to_bytes(jumlah_byte, "little"), dtype=np.uint8),
+                         bitorder="little")[:kapasitas + 1].astype(bool)
+    bisa[0] = False  # total 0 tidak dihitung sebagai rencana (sama seperti backtracking)
+    terbaik_sampai = np.maximum.accumulate(np.where(bisa, np.arange(kapasitas + 1, dtype=np.int64), 0))
+    
+    valid = budget >= 0
+    total_biaya[valid] = terbaik_sampai[budget[valid] // satuan_harga] * satuan_harga
+    return {"total_biaya": total_biaya, "sisa_budget": budget - total_biaya}
+
+class CacheSubsetSum:
+    """
+    Cache LRU untuk subset sum kategori pilih-banyak (makan, wisata, belanja).
+    Kunci: (kategori, batas kategori, bucket sisa budget). Nilai: daftar (total, subset saksi)
+    untuk setiap total yang bisa dicapai, dengan subset saksi = subset pertama yang ditemukan
+    backtracking untuk total tersebut, dalam urutan ditemukannya. Karena kategori berikutnya
+    hanya bergantung pada total, cukup satu saksi per total dan hasil pencarian tetap sama.
+    File cache (path) disimpan sebagai JSON, bukan pickle, sehingga memuat file dari sumber
+    lain tidak bisa menjalankan kode; pengenal kategori harus berupa str/int/tuple.
+    """
+    def __init__(self, ukuran_maks=1024, ukuran_bucket=100000, path=None):
+        self.ukuran_maks = ukuran_maks
+        self.ukuran_bucket = ukuran_bucket  # lebar bucket sisa budget (Rp)
+        self.path = path  # file untuk menyimpan cache antar proses (opsional)
+        self.hit = 0
+        self.miss = 0
+        self._data = OrderedDict()
+        if path is not None and os.path.exists(path):
+            self.muat()
+    
+    def __len__(self):
+        return len(self._data)
+    
+    def ambil(self, kategori, harga, batas, sisa_budget):
+        """
+        Daftar (total, subset saksi) dengan total <= min(batas, sisa_budget).
+        kategori: pengenal kategori, misalnya (kunci, sidik jari harga)
+        """
+        # Hasil untuk batas efektif (ujung atas bucket) juga berlaku untuk sisa budget yang lebih kecil
+        batas_efektif = min(batas, (sisa_budget // self.ukuran_bucket + 1) * self.ukuran_bucket - 1)
+        kunci = (kategori, batas, batas_efektif)
+        if kunci in self._data:
+            self.hit += 1
+            self._data.move_to_end(kunci)
+            daftar = self._data[kunci]
+        else:
+            self.miss += 1
+            daftar = _subset_sum_saksi(harga, batas_efektif)
+            self._data[kunci] = daftar
+            if len(self._data) > self.ukuran_maks:
+                self._data.popitem(last=False)  # buang yang paling lama tidak dipakai
+        if batas_efektif <= sisa_budget:
+            return daftar
+        return [(total, saksi) for total, saksi in daftar if total <= sisa_budget]
+    
+    def simpan(self):
+        """Menyimpan isi cache ke self.path (JSON, urutan LRU ikut tersimpan)"""
+        isi = [[kunci, [[total, list(saksi)] for total, saksi in daftar]] for kunci, daftar in self._data.items()]
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"cache_subset_sum": isi}, f)
+    
+    def muat(self):
+        """Memuat isi cache dari self.path; list JSON dikembalikan menjadi tuple seperti kunci aslinya"""
+        with open(self.path, encoding="utf-8") as f:
+            isi = json.load(f)["cache_subset_sum"]
+        self._data = OrderedDict(
+            (_ke_tuple(kunci), [(total, tuple(saksi)) for total, saksi in daftar]) for kunci, daftar in isi
+        )
+        while len(self._data) > self.ukuran_maks:
+            self._data.popitem(last=False)
+
+def _ke_tuple(nilai):
+    """Mengubah list (bersarang) hasil JSON kembali menjadi tuple agar bisa dipakai sebagai kunci dict"""
+    return tuple(_ke_tuple(v) for v in nilai) if isinstance(nilai, list) else nilai
+
+def _subset_sum_saksi(harga, batas):
+    """
+    Semua total subset tidak kosong <= batas beserta subset pertama (urutan backtracking:
+    "pilih" sebelum "tidak pilih") yang mencapainya. State (index, total, sudah_pilih) yang
+    sudah pernah dikunjungi dilewati, karena semua totalnya sudah ditemukan lebih dulu.
+    Memakai tumpukan eksplisit, jadi tidak dibatasi kedalaman rekursi Python.
+    """
+    hasil = []
+    sudah_ada = set()
+    dikunjungi = set()
+    jalur = []
+    jumlah_opsi = len(harga)
+    
+    # Frame: [index, total, tahap]; tahap 0 = masuk state dan coba pilih, 1 = tidak pilih
+    tumpukan = [[0, 0, 0]]
+    while tumpukan:
+        frame = tumpukan[-1]
+        index, total, tahap = frame
+        if tahap == 0:
+            state = (index, total, bool(jalur))
+            if state in dikunjungi:
+                tumpukan.pop()
+                continue
+            dikunjungi.add(state)
+            if index >= jumlah_opsi:
+                if jalur and total not in sudah_ada:
+                    sudah_ada.add(total)
+                    hasil.append((total, tuple(jalur)))
+                tumpukan.pop()
+                continue
+            frame[2] = 1
+            if total + harga[index] <= batas:
+                jalur.append(index)
+                tumpukan.append([index + 1, total + harga[index], 0])
+        else:
+            # Batalkan pilihan (jika tadi dipilih); frame ini lalu dipakai ulang untuk cabang "tidak pilih"
+            if jalur and jalur[-1] == index:
+                jalur.pop()
+            frame[0] = index + 1
+            frame[2] = 0
+    return hasil
+
+class StatistikPencarian:
+    """
+    Instrumentasi opsional untuk rencana_tanpa_salin.
+    Per kategori dicatat: node yang dikunjungi, daun layak (pilihan lengkap yang diteruskan ke
+    kategori berikutnya), perbaikan rencana terbaik (kategori yang pilihannya berubah dari
+    rencana terbaik sebelumnya) dan waktu eksklusif (detik) yang dihabiskan di kategori itu.
+    callback(statistik, rencana) dipanggil setiap kali rencana terbaik membaik.
+    """
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.kunci = []
+        self.node = []
+        self.daun_layak = []
+        self.perbaikan = []
+        self.waktu = []
+        self.jumlah_perbaikan = 0
     
+    def mulai(self, kunci):
+        """Mengosongkan semua penghitung untuk pencarian baru"""
+        self.kunci = list(kunci)
+        self.node = [0] * len(self.kunci)
+        self.daun_layak = [0] * len(self.kunci)
+        self.perbaikan = [0] * len(self.kunci)
+        self.waktu = [0.0] * len(self.kunci)
+        self.jumlah_perbaikan = 0
+    
+    def tampilkan(self):
+        """Menampilkan tabel statistik per kategori"""
+        print(f"{'Kategori':<15}{'Node':>12}{'Daun Layak':>12}{'Perbaikan':>11}{'Waktu (detik)':>15}")
+        for k, kunci in enumerate(self.kunci):
+            print(f"{kunci:<15}{self.node[k]:>12,}{self.daun_layak[k]:>12,}{self.perbaikan[k]:>11,}{self.waktu[k]:>15.6f}")
+        print(f"{'Total':<15}{sum(self.node):>12,}{sum(self.daun_layak):>12,}{self.jumlah_perbaikan:>11,}"
+              f"{sum(self.waktu):>15.6f}")
+
+def rencana_tanpa_salin(budget_total, statistik=None, katalog=None, cache=None, instrumen=None):
+    """
+    Backtracking tanpa menyalin rencana di setiap langkah.
+    Hanya ada satu state: tumpukan index opsi per kategori dan total biaya berupa int.
+    Setiap pilihan dibatalkan lagi (pop) saat kembali, dan dict hasil hanya dibuat
+    saat ditemukan rencana terbaik baru. Urutan pencarian sama dengan backtracking biasa.
+    cache: CacheSubsetSum opsional; kategori pilih-banyak lalu hanya mencoba satu subset
+           per total yang berbeda, bukan semua subset.
+    instrumen: StatistikPencarian opsional. Jika None, fungsi pencatat tidak dipasang sama sekali
+               sehingga tidak ada tambahan biaya di setiap node.
+    """
+    katalog = _katalog(katalog)
+    harga = katalog.harga_list()
+    batas = katalog.batas
+    if cache is not None:
+        pengenal = [(kunci, katalog.sidik_jari(k)) for k, kunci in enumerate(katalog.kunci)]
+    jumlah_kategori = len(katalog)
+    dipilih = [[] for _ in range(jumlah_kategori)]  # tumpukan index opsi yang dipilih per kategori
+    total = 0
+    total_terbaik = 0
+    rencana_terbaik = _rencana_kosong(budget_total, katalog)
+    dipilih_terbaik = None
+    node_kategori = [0] * jumlah_kategori  # node yang dikunjungi per kategori
+    
+    def simpan_terbaik():
+        """Membuat dict rencana dari state saat ini"""
+        nonlocal rencana_terbaik, total_terbaik, dipilih_terbaik
+        rencana_terbaik = _susun_rencana(katalog, dipilih, budget_total)
+        total_terbaik = total
+        if instrumen is not None:
+            instrumen.jumlah_perbaikan += 1
+            for k in range(jumlah_kategori):
+                if dipilih_terbaik is None or dipilih[k] != dipilih_terbaik[k]:
+                    instrumen.perbaikan[k] += 1
+            dipilih_terbaik = [d.copy() for d in dipilih]
+            if instrumen.callback is not None:
+                instrumen.callback(instrumen, rencana_terbaik)
+    
+    def telusuri(k):
+        nonlocal total
+        if k == jumlah_kategori:
+            if total > total_terbaik:
+                simpan_terbaik()
+            return
+        
+        node_kategori[k] += 1
+        if batas[k] is not None and cache is not None:
+            for total_kategori, saksi in cache.ambil(pengenal[k], harga[k], batas[k], budget_total - total):
+                dipilih[k].extend(saksi)
+                total += total_kategori
+                telusuri(k + 1)
+                total -= total_kategori
+                dipilih[k].clear()
+            return
+        if batas[k] is not None:
+            telusuri_banyak(k)
+            return
+        
+        # Kategori pilih-satu
+        for i, h in enumerate(harga[k]):
+            if h <= budget_total - total:
+                dipilih[k].append(i)
+                total += h
+                telusuri(k + 1)
+                total -= h
+                dipilih[k].pop()
+    
+    def telusuri_banyak(k):
+        """
+        Semua subset kategori pilih-banyak ke-k dengan tumpukan eksplisit (bukan rekursi per opsi,
+        sehingga kategori dengan ratusan ribu opsi tetap bisa ditelusuri). Urutannya sama dengan
+        rekursi biasa: "pilih" sebelum "tidak pilih"; setiap subset tidak kosong diteruskan ke telusuri(k + 1).
+        """
+        nonlocal total
+        harga_k = harga[k]
+        batas_k = batas[k]
+        dipilih_k = dipilih[k]
+        jumlah_opsi = len(harga_k)
+        # Frame: [index opsi, total kategori, tahap]; tahap 0 = pilihan 1, 1 = pilihan 2
+        tumpukan = [[0, 0, 0]]
+        while tumpukan:
+            frame = tumpukan[-1]
+            index, total_kategori, tahap = frame
+            if index >= jumlah_opsi:
+                tumpukan.pop()
+                # Lanjut ke kategori berikutnya jika sudah memilih setidaknya satu opsi
+                if dipilih_k:
+                    telusuri(k + 1)
+            elif tahap == 0:
+                node_kategori[k] += 1
+                frame[2] = 1
+                # Pilihan 1: pilih opsi saat ini
+                h = harga_k[index]
+                if h + total_kategori <= batas_k and h <= budget_total - total:
+                    dipilih_k.append(index)
+                    total += h
+                    tumpukan.append([index + 1, total_kategori + h, 0])
+            else:
+                # Pilihan 2: batalkan pilihan 1 (jika tadi dipilih) lalu tidak pilih opsi saat ini;
+                # frame yang sama dipakai ulang untuk opsi berikutnya
+                if dipilih_k and dipilih_k[-1] == index:
+                    dipilih_k.pop()
+                    total -= harga_k[index]
+                frame[0] = index + 1
+                frame[2] = 0
+    
+    if instrumen is not None:
+        # Pasang pembungkus pencatat. telusuri_banyak memanggil telusuri lewat namanya, jadi setelah
+        # nama itu diganti semua kategori ikut tercatat. Node per kategori langsung memakai node_kategori.
+        instrumen.mulai(katalog.kunci)
+        instrumen.node = node_kategori
+        telusuri_polos = telusuri
+        waktu_terakhir = time.perf_counter()
+        
+        def catat_waktu(k):
+            """Membebankan waktu sejak pencatatan terakhir ke kategori ke-k"""
+            nonlocal waktu_terakhir
+            sekarang = time.perf_counter()
+            instrumen.waktu[k] += sekarang - waktu_terakhir
+            waktu_terakhir = sekarang
+        
+        def telusuri(k):
+            # Masuk ke kategori k berarti kategori k-1 sudah punya pilihan lengkap yang layak
+            if k > 0:
+                instrumen.daun_layak[k - 1] += 1
+            if k == jumlah_kategori:
+                telusuri_polos(k)
+                return
+            # Waktu sebelum masuk dihitung untuk kategori pemanggil, waktu di dalam untuk kategori k
+            if k > 0:
+                catat_waktu(k - 1)
+            telusuri_polos(k)
+            catat_waktu(k)
+    
+    telusuri(0)
+    
+    if statistik is not None:
+        statistik["node_dikunjungi"] = sum(node_kategori)
+        statistik["node_dipangkas"] = 0
     return rencana_terbaik
 
+# State milik setiap proses pekerja pada pencarian paralel (diisi oleh _mulai_pekerja)
+_katalog_pekerja = None
+_terbaik_bersama = None
+
+def _mulai_pekerja(katalog, terbaik_bersama):
+    """Initializer pekerja: katalog dan rencana terbaik bersama dikirim sekali per proses"""
+    global _katalog_pekerja, _terbaik_bersama
+    _katalog_pekerja = katalog
+    _terbaik_bersama = terbaik_bersama
+
+def _telusuri_subpohon(budget_total, awal, nomor_subpohon, jumlah_subpohon):
+    """
+    Pencarian tanpa salin + branch and bound pada satu subpohon (dijalankan di proses pekerja).
+    awal berisi index opsi untuk kategori pilih-satu di awal yang sudah ditetapkan.
+    Cabang dipangkas jika batas atasnya tidak bisa mengalahkan rencana terbaik bersama.
+    """
+    katalog = _katalog_pekerja
+    terbaik_bersama = _terbaik_bersama
+    nilai_bersama = terbaik_bersama.get_obj()  # dibaca tanpa lock, ditulis dengan lock
+    harga = katalog.harga_list()
+    batas = katalog.batas
+    jumlah_kategori = len(katalog)
+    batas_setelah, sisa_harga = _batas_pencarian(harga, batas)
+    
+    # Total biaya dan nomor subpohon digabung menjadi satu kunci pembanding di nilai bersama:
+    # total lebih besar menang; jika sama, subpohon yang lebih awal (urutan backtracking) menang
+    pengali = jumlah_subpohon + 1
+    tambahan_kunci = jumlah_subpohon - nomor_subpohon
+    dipilih = [[] for _ in range(jumlah_kategori)]
+    total = 0
+    for k, i in enumerate(awal):
+        dipilih[k].append(i)
+        total += harga[k][i]
+    dipilih_terbaik = None
+    total_terbaik = None
+    node_dikunjungi = 0
+    node_dipangkas = 0
+    
+    def dipangkas(tambahan_maks):
+        nonlocal node_dikunjungi, node_dipangkas
+        node_dikunjungi += 1
+        batas_atas = total + min(budget_total - total, tambahan_maks)
+        if batas_atas * pengali + tambahan_kunci <= nilai_bersama.value:
+            node_dipangkas += 1
+            return True
+        return False
+    
+    def cek_rencana():
+        nonlocal dipilih_terbaik, total_terbaik
+        kunci = total * pengali + tambahan_kunci
+        if kunci <= nilai_bersama.value:
+            return
+        with terbaik_bersama.get_lock():
+            if kunci <= nilai_bersama.value:
+                return
+            nilai_bersama.value = kunci
+        dipilih_terbaik = [d.copy() for d in dipilih]
+        total_terbaik = total
+    
+    def telusuri(k):
+        nonlocal total
+        if k == jumlah_kategori:
+            cek_rencana()
+            return
+        if dipangkas(batas_setelah[k]):
+            return
+        if batas[k] is not None:
+            telusuri_banyak(k)
+            return
+        for i, h in enumerate(harga[k]):
+            if h <= budget_total - total:
+                dipilih[k].append(i)
+                total += h
+                telusuri(k + 1)
+                total -= h
+                dipilih[k].pop()
+    
+    def telusuri_banyak(k):
+        # Tumpukan eksplisit seperti di rencana_tanpa_salin, ditambah pemangkasan di setiap node
+        nonlocal total
+        harga_k = harga[k]
+        batas_k = batas[k]
+        sisa_k = sisa_harga[k]
+        batas_berikutnya = batas_setelah[k + 1]
+        dipilih_k = dipilih[k]
+        jumlah_opsi = len(harga_k)
+        tumpukan = [[0, 0, 0]]  # [index opsi, total kategori, tahap]
+        while tumpukan:
+            frame = tumpukan[-1]
+            index, total_kategori, tahap = frame
+            if index >= jumlah_opsi:
+                tumpukan.pop()
+                if dipilih_k:
+                    telusuri(k + 1)
+            elif tahap == 0:
+                if dipangkas(min(batas_k - total_kategori, sisa_k[index]) + batas_berikutnya):
+                    tumpukan.pop()
+                    continue
+                frame[2] = 1
+                h = harga_k[index]
+                if h + total_kategori <= batas_k and h <= budget_total - total:
+                    dipilih_k.append(index)
+                    total += h
+                    tumpukan.append([index + 1, total_kategori + h, 0])
+            else:
+                if dipilih_k and dipilih_k[-1] == index:
+                    dipilih_k.pop()
+                    total -= harga_k[index]
+                frame[0] = index + 1
+                frame[2] = 0
+    
+    telusuri(len(awal))
+    return total_terbaik, dipilih_terbaik, node_dikunjungi, node_dipangkas
+
+def rencana_paralel(budget_total, workers=None, kedalaman_split=None, statistik=None, katalog=None):
+    """
+    Pencarian paralel dengan ProcessPoolExecutor.
+    Kategori pilih-satu di awal (pesawat, komunikasi, hotel) dipecah sampai kedalaman_split
+    menjadi subpohon yang independen; None berarti sebanyak kategori pilih-satu yang ada, maksimal 3. Semua pekerja berbagi total terbaik sehingga rencana
+    bagus dari satu pekerja ikut memangkas pencarian pekerja lain.
+    Hasilnya sama persis dengan pencarian berurutan.
+    """
+    katalog = _katalog(katalog)
+    jumlah_pilih_satu = 0
+    while jumlah_pilih_satu < len(katalog) and katalog.batas[jumlah_pilih_satu] is None:
+        jumlah_pilih_satu += 1
+    if kedalaman_split is None:
+        kedalaman_split = min(3, jumlah_pilih_satu)
+    if not 0 <= kedalaman_split <= jumlah_pilih_satu:
+        raise ValueError(f"kedalaman_split harus antara 0 dan {jumlah_pilih_satu}")
+    
+    # Daftar subpohon (prefix index opsi) dalam urutan backtracking
+    subpohon = [((), 0)]
+    for k in range(kedalaman_split):
+        subpohon_baru = []
+        for awal, total in subpohon:
+            for i, h in enumerate(katalog.harga[k]):
+                if h <= budget_total - total:
+                    subpohon_baru.append((awal + (i,), total + h))
+        subpohon = subpohon_baru
+    
+    terbaik_bersama = Value("q", 0)
+    hasil_subpohon = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_mulai_pekerja,
+                             initargs=(katalog, terbaik_bersama)) as executor:
+        futures = [executor.submit(_telusuri_subpohon, budget_total, awal, nomor, len(subpohon))
+                   for nomor, (awal, _) in enumerate(subpohon)]
+        for future in futures:
+            hasil_subpohon.append(future.result())
+    
+    # Gabungkan: total terbesar, jika sama ambil subpohon paling awal
+    rencana_terbaik = _rencana_kosong(budget_total, katalog)
+    total_terbaik = 0
+    for total, dipilih, _, _ in hasil_subpohon:
+        if total is not None and total > total_terbaik:
+            total_terbaik = total
+            rencana_terbaik = _susun_rencana(katalog, dipilih, budget_total)
+    
+    if statistik is not None:
+        statistik["node_dikunjungi"] = sum(h[2] for h in hasil_subpohon)
+        statistik["node_dipangkas"] = sum(h[3] for h in hasil_subpohon)
+    return rencana_terbaik
+
+def _rencana_greedy(budget_total, harga, batas):
+    """
+    Rencana awal cepat (greedy) untuk mode anytime: setiap kategori memilih opsi termahal yang
+    masih menyisakan cukup uang untuk biaya minimum kategori berikutnya.
+    Mengembalikan (total, index terpilih per kategori) atau None jika greedy tidak menemukan rencana.
+    """
+    biaya_minimum = [min(h) if h else 0 for h in harga]
+    cadangan = [0] * (len(harga) + 1)
+    for k in range(len(harga) - 1, -1, -1):
+        cadangan[k] = cadangan[k + 1] + biaya_minimum[k]
+    
+    total = 0
+    dipilih = []
+    for k, h_kategori in enumerate(harga):
+        ruang = budget_total - total - cadangan[k + 1]
+        urutan = sorted(range(len(h_kategori)), key=lambda i: -h_kategori[i])
+        terpilih = []
+        if batas[k] is None:
+            for i in urutan:
+                if h_kategori[i] <= ruang:
+                    terpilih.append(i)
+                    break
+        else:
+            total_kategori = 0
+            for i in urutan:
+                if total_kategori + h_kategori[i] <= min(batas[k], ruang):
+                    terpilih.append(i)
+                    total_kategori += h_kategori[i]
+        if not terpilih:
+            return None
+        terpilih.sort()
+        dipilih.append(terpilih)
+        total += sum(h_kategori[i] for i in terpilih)
+    return total, dipilih
+
+def rencana_bertahap(budget_total, deadline_seconds=None, max_nodes=None, katalog=None, statistik=None):
+    """
+    Mode anytime: generator yang menghasilkan (yield) setiap rencana_terbaik baru begitu ditemukan.
+    Rencana pertama berasal dari greedy sehingga jawaban awal muncul dalam hitungan milidetik,
+    lalu branch and bound dengan tumpukan eksplisit (tanpa rekursi) terus memperbaikinya.
+    Pencarian berhenti jika deadline_seconds atau max_nodes terlampaui.
+    Nilai return generator: (rencana_terbaik, terbukti_optimal). Jika pencarian selesai,
+    hasilnya sama dengan rencana_liburan_korea.
+    """
+    mulai = time.perf_counter()
+    katalog = _katalog(katalog)
+    harga = katalog.harga_list()
+    batas = katalog.batas
+    jumlah_kategori = len(katalog)
+    rencana_terbaik = _rencana_kosong(budget_total, katalog)
+    total_terbaik = 0
+    # Rencana greedy boleh digantikan rencana backtracking dengan total yang sama, supaya hasil
+    # akhirnya sama dengan rencana yang pertama ditemukan backtracking
+    dari_greedy = False
+    greedy = _rencana_greedy(budget_total, harga, batas)
+    if greedy is not None and greedy[0] > 0:
+        total_terbaik, dipilih_greedy = greedy
+        rencana_terbaik = _susun_rencana(katalog, dipilih_greedy, budget_total)
+        dari_greedy = True
+        yield rencana_terbaik
+    
+    # Batas atas dihitung setelah rencana greedy dikirim agar jawaban pertama tidak tertunda
+    batas_setelah, sisa_harga = _batas_pencarian(harga, batas)
+    
+    dipilih = [[] for _ in range(jumlah_kategori)]
+    total = 0
+    node_dikunjungi = 0
+    node_dipangkas = 0
+    terbukti_optimal = True
+    
+    # Frame: [kategori, index opsi, total kategori, tahap, harga yang perlu dibatalkan]
+    # tahap -1 = frame baru; pilih-satu: tahap = opsi berikutnya; pilih-banyak: 0 pilih, 1 tidak pilih, 2 selesai
+    tumpukan = [[0, 0, 0, -1, None]]
+    while tumpukan:
+        frame = tumpukan[-1]
+        k, index, total_kategori, tahap, dibatalkan = frame
+        if dibatalkan is not None:
+            total -= dibatalkan
+            dipilih[k].pop()
+            frame[4] = None
+        
+        if k == jumlah_kategori:
+            tumpukan.pop()
+            if total > total_terbaik or (dari_greedy and total == total_terbaik):
+                perbaikan = total > total_terbaik
+                rencana_terbaik = _susun_rencana(katalog, dipilih, budget_total)
+                total_terbaik = total
+                dari_greedy = False
+                if perbaikan:
+                    yield rencana_terbaik
+                if total_terbaik == budget_total:
+                    break  # tidak mungkin lebih baik dari budget yang terpakai penuh
+            continue
+        
+        pilih_banyak = batas[k] is not None
+        if pilih_banyak and index >= len(harga[k]):
+            tumpukan.pop()
+            if dipilih[k]:
+                tumpukan.append([k + 1, 0, 0, -1, None])
+            continue
+        
+        if tahap == -1:
+            node_dikunjungi += 1
+            if max_nodes is not None and node_dikunjungi > max_nodes:
+                terbukti_optimal = False
+                break
+            if deadline_seconds is not None and node_dikunjungi % 1024 == 0 \
+                    and time.perf_counter() - mulai > deadline_seconds:
+                terbukti_optimal = False
+                break
+            if pilih_banyak:
+                tambahan_maks = min(batas[k] - total_kategori, sisa_harga[k][index]) + batas_setelah[k + 1]
+            else:
+                tambahan_maks = batas_setelah[k]
+            batas_atas = total + min(budget_total - total, tambahan_maks)
+            if batas_atas < total_terbaik or (batas_atas == total_terbaik and not dari_greedy):
+                node_dipangkas += 1
+                tumpukan.pop()
+                continue
+            tahap = frame[3] = 0
+        
+        if not pilih_banyak:
+            # Coba opsi berikutnya yang masih masuk budget
+            i = tahap
+            while i < len(harga[k]) and harga[k][i] > budget_total - total:
+                i += 1
+            if i == len(harga[k]):
+                tumpukan.pop()
+                continue
+            frame[3] = i + 1
+            frame[4] = harga[k][i]
+            dipilih[k].append(i)
+            total += harga[k][i]
+            tumpukan.append([k + 1, 0, 0, -1, None])
+            continue
+        
+        h = harga[k][index]
+        if tahap == 0:
+            frame[3] = 1
+            if h + total_kategori <= batas[k] and h <= budget_total - total:
+                frame[4] = h
+                dipilih[k].append(index)
+                total += h
+                tumpukan.append([k, index + 1, total_kategori + h, -1, None])
+        elif tahap == 1:
+            frame[3] = 2
+            tumpukan.append([k, index + 1, total_kategori, -1, None])
+        else:
+            tumpukan.pop()
+    
+    if statistik is not None:
+        statistik["node_dikunjungi"] = node_dikunjungi
+        statistik["node_dipangkas"] = node_dipangkas
+        statistik["waktu"] = time.perf_counter() - mulai
+    return rencana_terbaik, terbukti_optimal
+
+def rencana_anytime(budget_total, deadline_seconds=None, max_nodes=None, katalog=None, statistik=None):
+    """
+    Menjalankan rencana_bertahap sampai selesai atau batas tercapai.
+    Mengembalikan (rencana_terbaik, terbukti_optimal).
+    """
+    pencarian = rencana_bertahap(budget_total, deadline_seconds, max_nodes, katalog, statistik)
+    while True:
+        try:
+            next(pencarian)
+        except StopIteration as selesai:
+            return selesai.value
+
+def rencana_top_k(budget_total, k=5, pareto=False, statistik=None, katalog=None):
+    """
+    Mencari k rencana terbaik (total biaya tertinggi) dalam satu kali pencarian.
+    Rencana disimpan di min-heap berukuran k sehingga memori tetap terbatas; cabang
+    yang batas atasnya tidak bisa masuk k besar dipangkas.
+    pareto=True juga menghitung frontier Pareto antara biaya (lebih murah lebih baik) dan
+    jumlah tempat yang dikunjungi (lebih banyak lebih baik). Untuk itu semua cabang
+    harus ditelusuri, jadi pemangkasan dimatikan.
+    Mengembalikan dict {"top_k": [...], "pareto": [...]} berisi rencana dengan bentuk rencana_terbaik.
+    """
+    if k < 1:
+        raise ValueError("k minimal 1")
+    katalog = _katalog(katalog)
+    harga = katalog.harga_list()
+    batas = katalog.batas
+    jumlah_kategori = len(katalog)
+    batas_setelah, sisa_harga = _batas_pencarian(harga, batas)
+    pangkas = not pareto
+    
+    dipilih = [[] for _ in range(jumlah_kategori)]
+    total = 0
+    jumlah_tempat = 0  # banyaknya opsi terpilih di kategori pilih-banyak
+    urutan = 0  # nomor urut rencana lengkap, untuk memilih yang ditemukan lebih dulu jika total sama
+    # Isi heap: (total, -urutan, index terpilih); heap[0] adalah rencana terburuk di top-k
+    heap = []
+    # Rencana termurah untuk setiap jumlah tempat: jumlah_tempat -> (total, index terpilih)
+    termurah = {}
+    node_dikunjungi = 0
+    node_dipangkas = 0
+    
+    def dipangkas(tambahan_maks):
+        nonlocal node_dikunjungi, node_dipangkas
+        node_dikunjungi += 1
+        if pangkas and len(heap) == k and total + min(budget_total - total, tambahan_maks) <= heap[0][0]:
+            node_dipangkas += 1
+            return True
+        return False
+    
+    def cek_rencana():
+        nonlocal urutan
+        urutan += 1
+        if total <= 0:
+            return  # sama seperti backtracking: rencana tanpa biaya tidak dihitung
+        if len(heap) < k:
+            heapq.heappush(heap, (total, -urutan, tuple(tuple(d) for d in dipilih)))
+        elif total > heap[0][0]:
+            heapq.heapreplace(heap, (total, -urutan, tuple(tuple(d) for d in dipilih)))
+        if pareto and (jumlah_tempat not in termurah or total < termurah[jumlah_tempat][0]):
+            termurah[jumlah_tempat] = (total, tuple(tuple(d) for d in dipilih))
+    
+    def telusuri(i):
+        nonlocal total
+        if i == jumlah_kategori:
+            cek_rencana()
+            return
+        if dipangkas(batas_setelah[i]):
+            return
+        if batas[i] is not None:
+            telusuri_banyak(i)
+            return
+        for j, h in enumerate(harga[i]):
+            if h <= budget_total - total:
+                dipilih[i].append(j)
+                total += h
+                telusuri(i + 1)
+                total -= h
+                dipilih[i].pop()
+    
+    def telusuri_banyak(i):
+        # Tumpukan eksplisit seperti di rencana_tanpa_salin, ditambah pemangkasan di setiap node
+        nonlocal total, jumlah_tempat
+        harga_i = harga[i]
+        batas_i = batas[i]
+        sisa_i = sisa_harga[i]
+        batas_berikutnya = batas_setelah[i + 1]
+        dipilih_i = dipilih[i]
+        jumlah_opsi = len(harga_i)
+        tumpukan = [[0, 0, 0]]  # [index opsi, total kategori, tahap]
+        while tumpukan:
+            frame = tumpukan[-1]
+            index, total_kategori, tahap = frame
+            if index >= jumlah_opsi:
+                tumpukan.pop()
+                if dipilih_i:
+                    telusuri(i + 1)
+            elif tahap == 0:
+                if dipangkas(min(batas_i - total_kategori, sisa_i[index]) + batas_berikutnya):
+                    tumpukan.pop()
+                    continue
+                frame[2] = 1
+                h = harga_i[index]
+                if h + total_kategori <= batas_i and h <= budget_total - total:
+                    dipilih_i.append(index)
+                    total += h
+                    jumlah_tempat += 1
+                    tumpukan.append([index + 1, total_kategori + h, 0])
+            else:
+                if dipilih_i and dipilih_i[-1] == index:
+                    dipilih_i.pop()
+                    total -= harga_i[index]
+                    jumlah_tempat -= 1
+                frame[0] = index + 1
+                frame[2] = 0
+    
+    telusuri(0)
+    
+    # Frontier Pareto: dari jumlah tempat terbanyak ke tersedikit, simpan yang lebih murah
+    frontier = []
+    biaya_minimum = None
+    for jumlah in sorted(termurah, reverse=True):
+        total_jumlah, terpilih = termurah[jumlah]
+        if biaya_minimum is None or total_jumlah < biaya_minimum:
+            frontier.append(_susun_rencana(katalog, terpilih, budget_total))
+            biaya_minimum = total_jumlah
+    frontier.reverse()
+    
+    if statistik is not None:
+        statistik["node_dikunjungi"] = node_dikunjungi
+        statistik["node_dipangkas"] = node_dipangkas
+    return {
+        "top_k": [_susun_rencana(katalog, terpilih, budget_total) for _, _, terpilih in sorted(heap, reverse=True)],
+        "pareto": frontier
+    }
+
+def tampilkan_top_k(hasil, budget_total, katalog=None):
+    """Menampilkan ringkasan rencana top-k dan frontier Pareto"""
+    katalog = _katalog(katalog)
+    
+    def ringkasan(rencana):
+        tempat = []
+        for kunci, batas in zip(katalog.kunci, katalog.batas):
+            if batas is not None:
+                tempat.extend(o["nama"] for o in rencana[kunci])
+        return f"Rp {rencana['total_biaya']:,} (sisa Rp {rencana['sisa_budget']:,}) - {len(tempat)} tempat: {', '.join(tempat)}"
+    
+    print(f"=== {len(hasil['top_k'])} RENCANA TERBAIK (Budget Rp {budget_total:,}) ===")
+    for i, rencana in enumerate(hasil["top_k"], 1):
+        print(f"{i}. {ringkasan(rencana)}")
+    if hasil["pareto"]:
+        print("\n=== FRONTIER PARETO (BIAYA vs JUMLAH TEMPAT) ===")
+        for rencana in hasil["pareto"]:
+            print(f"- {ringkasan(rencana)}")
+
+def _ukur_alokasi(fungsi, *args, **kwargs):
+    """
+    Menjalankan fungsi di bawah tracemalloc dan mengembalikan (total alokasi, memori puncak) dalam byte.
+    Memori yang dilacak dibaca di setiap baris yang dieksekusi dan setiap kenaikannya dijumlahkan,
+    sehingga objek sementara yang langsung dibuang (misalnya salinan rencana per node) ikut terhitung,
+    bukan hanya puncaknya. Pelacakan per baris membuat fungsi jauh lebih lambat dari biasanya.
+    """
+    ambil = tracemalloc.get_traced_memory
+    total_alokasi = 0
+    terakhir = 0
+    
+    def lacak(frame, event, arg):
+        nonlocal total_alokasi, terakhir
+        sekarang = ambil()[0]
+        if sekarang > terakhir:
+            total_alokasi += sekarang - terakhir
+        terakhir = sekarang
+        return lacak
+    
+    tracemalloc.start()
+    terakhir = ambil()[0]
+    sys.settrace(lacak)
+    try:
+        fungsi(*args, **kwargs)
+    finally:
+        sys.settrace(None)
+        _, memori_puncak = ambil()
+        tracemalloc.stop()
+    return total_alokasi, memori_puncak
+
+def uji_kinerja_backtracking(budget_total=50000000, metode_diuji=("backtracking", "tanpa_salin"), ulang=3):
+    """
+    Membandingkan total alokasi dan memori puncak (tracemalloc) serta throughput node (node/detik)
+    antar metode. Waktu diukur tanpa tracemalloc (waktu terbaik dari beberapa ulangan), alokasi
+    diukur pada satu jalan terpisah dengan _ukur_alokasi.
+    """
+    hasil = {
+        "Metode": [],
+        "Waktu (detik)": [],
+        "Node": [],
+        "Node/detik": [],
+        "Total Alokasi (KB)": [],
+        "Memori Puncak (KB)": []
+    }
+    
+    for metode in metode_diuji:
+        waktu_terbaik = None
+        statistik = {}
+        for _ in range(ulang):
+            start = time.perf_counter()
+            rencana_liburan_korea(budget_total, metode, statistik=statistik, tampilkan=False)
+            waktu = time.perf_counter() - start
+            if waktu_terbaik is None or waktu < waktu_terbaik:
+                waktu_terbaik = waktu
+        
+        total_alokasi, memori_puncak = _ukur_alokasi(rencana_liburan_korea, budget_total, metode, tampilkan=False)
+        
+        node = statistik.get("node_dikunjungi", 0)
+        hasil["Metode"].append(metode)
+        hasil["Waktu (detik)"].append(round(waktu_terbaik, 6))
+        hasil["Node"].append(node)
+        hasil["Node/detik"].append(round(node / max(waktu_terbaik, 1e-9)))
+        hasil["Total Alokasi (KB)"].append(round(total_alokasi / 1024, 1))
+        hasil["Memori Puncak (KB)"].append(round(memori_puncak / 1024, 1))
+    
+    print("\n=== UJI KINERJA BACKTRACKING ===")
+    print(f"{'Metode':<18}{'Waktu (detik)':>15}{'Node':>12}{'Node/detik':>14}{'Alokasi (KB)':>16}{'Puncak (KB)':>14}")
+    for i in range(len(hasil["Metode"])):
+        print(f"{hasil['Metode'][i]:<18}{hasil['Waktu (detik)'][i]:>15.6f}{hasil['Node'][i]:>12,}"
+              f"{hasil['Node/detik'][i]:>14,}{hasil['Total Alokasi (KB)'][i]:>16,.1f}"
+              f"{hasil['Memori Puncak (KB)'][i]:>14,.1f}")
+    
+    return hasil
+
 # Jalankan fungsi
-hasil = rencana_liburan_korea(50000000)
+if __name__ == "__main__":
+    hasil = rencana_liburan_korea(50000000)
 
 # 3. Logika Backtracking yang Digunakan dalam Program
 